@@ -1,9 +1,97 @@
 import os
-import json
-from typing import Optional, Dict, Any, Union
-from openai import OpenAI
+import re
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Union
+
+from openai import BadRequestError, OpenAI
 from rich.console import Console
 
+from .console import shared_console
+
+# orjson 为可选加速：未安装时退回标准库 json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# tiktoken 为可选依赖：安装后按 token 精确截断文章内容，否则退回按字符截断
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# 固定的摘要要求放在 system 消息中：每次请求都相同，既减少了重复的输入 token，也便于服务端缓存提示词前缀
+SYSTEM_PROMPT = textwrap.dedent("""
+    你是一个专业的文章摘要助手，为用户提供的文章生成简洁、准确的中文摘要。
+    要求：
+    1. 概括文章的主要内容和关键信息，突出核心观点
+    2. 使用简洁、通俗易懂的中文，长度控制在 200-300 字之间
+    3. 不要包含"本文"、"文章"等自指性词汇
+    4. 使用列表或段落格式清晰表达
+    5. 只输出摘要本身
+""").strip()
+
+# 批量摘要在固定要求之后追加输出格式说明
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT + textwrap.dedent("""
+    6. 用户会提供多篇编号的文章，请分别生成摘要，只输出 JSON 对象，格式为 {"summaries": [{"id": 文章编号, "summary": "摘要"}]}
+""").rstrip()
+
+
+@lru_cache(maxsize=4)
+def _load_config_file(config_file: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    读取并解析配置文件，按 (路径，修改时间) 缓存解析结果
+
+    配置文件未修改时直接复用上次的解析结果；修改时间变化后缓存键不同，会重新读取。
+    返回的字典被多次调用共享，调用方不应修改。
+
+    Args:
+        config_file: 配置文件路径
+        mtime_ns: 配置文件的修改时间（纳秒），仅用作缓存键
+    Returns:
+        Dict[str, Any]: 配置字典，读取或解析失败时为空字典
+    """
+    try:
+        with open(config_file, 'rb') as f:
+            return _json_loads(f.read())
+    except Exception:
+        return {}  # 使用默认配置
+
+
+# 模型名称 -> tiktoken 编码器（无法获取时为 None），编码器加载较慢，每个模型只加载一次
+_ENCODER_CACHE: Dict[str, Any] = {}
+
+
+def _get_encoder(model: Optional[str]):
+    """
+    获取模型对应的 tiktoken 编码器
+
+    Args:
+        model: 模型名称
+    Returns:
+        编码器实例；未安装 tiktoken 或未指定模型时返回 None
+    """
+    if tiktoken is None or not model:
+        return None
+    
+    if model not in _ENCODER_CACHE:
+        try:
+            try:
+                encoder = tiktoken.encoding_for_model(model)
+            except KeyError:
+                # 未知模型使用较新的通用编码
+                encoder = tiktoken.get_encoding("o200k_base")
+        except Exception:
+            # 编码数据无法加载（例如离线环境），退回按字符截断；结果同样缓存，不会每次调用都重试
+            encoder = None
+        _ENCODER_CACHE[model] = encoder
+    return _ENCODER_CACHE[model]
+
 
 class AIConfig:
     """AI 配置管理器，负责配置的加载、验证和管理"""
@@ -12,11 +100,42 @@ class AIConfig:
                  api_key: Optional[str] = None,
                  base_url: Optional[str] = None,
                  model: str = "gpt-5-nano",
-                 timeout: Optional[Union[int, float, str]] = None):
+                 timeout: Optional[Union[int, float, str]] = None,
+                 max_retries: Optional[Union[int, str]] = 5):
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         self.base_url = base_url
         self.model = model
         self.timeout = self._convert_timeout(timeout)
+        # 限流（429）、服务端错误（5xx）、连接错误和超时由 OpenAI 客户端按指数退避（带随机抖动）自动重试
+        self.max_retries = self._convert_max_retries(max_retries)
+    
+    # 重试次数的上限，避免配置错误时单篇摘要长时间反复重试
+    MAX_RETRIES_LIMIT = 10
+    
+    def _convert_max_retries(self, max_retries: Optional[Union[int, str]]) -> int:
+        """
+        将配置中的重试次数转换为整数，并限制在 [0, MAX_RETRIES_LIMIT] 范围内
+
+        Args:
+            max_retries: 可以是 int 或 str 类型的重试次数，None 表示使用默认值 5
+        Returns:
+            int: 转换后的重试次数
+        """
+        if max_retries is None:
+            return 5
+        
+        try:
+            if isinstance(max_retries, str):
+                retries_converted = int(max_retries.strip())
+            else:
+                retries_converted = int(max_retries)
+            
+            if retries_converted < 0:
+                raise ValueError("max_retries 不能为负数")
+            
+            return min(retries_converted, self.MAX_RETRIES_LIMIT)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"无效的 max_retries 值：{max_retries} ({e})") from e
         
     def _convert_timeout(self, timeout: Optional[Union[int, float, str]]) -> Optional[float]:
         """
@@ -75,20 +194,18 @@ class AIConfig:
         if self.timeout is not None:
             kwargs['timeout'] = self.timeout
         
+        kwargs['max_retries'] = self.max_retries
+        
         return kwargs
     
     @classmethod
     def from_config_file(cls, config_file: str = "config.json") -> 'AIConfig':
         """从配置文件创建配置对象"""
-        config = {}
-        
-        # 尝试加载配置文件
-        if os.path.exists(config_file):
-            try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            except Exception:
-                pass  # 使用默认配置
+        # 尝试加载配置文件，文件未修改时复用缓存的解析结果
+        try:
+            config = _load_config_file(config_file, os.stat(config_file).st_mtime_ns)
+        except OSError:
+            config = {}  # 使用默认配置
         
         ai_config = config.get('ai', {})
         
@@ -96,53 +213,131 @@ class AIConfig:
             api_key=ai_config.get('api_key'),
             base_url=ai_config.get('base_url'),
             model=ai_config.get('model', 'gpt-5-nano'),
-            timeout=ai_config.get('timeout')
+            timeout=ai_config.get('timeout'),
+            max_retries=ai_config.get('max_retries', 5)
         )
 
 
+@lru_cache(maxsize=256)
+def _truncate_content(content: str, max_content_length: int, model: Optional[str],
+                      max_content_tokens: int) -> Tuple[str, int]:
+    """
+    截断文章内容并返回截断后内容的 token 数
+    
+    批量摘要先按 token 数拆分批次、再构建提示词，两处对同一篇文章的截断结果相同；
+    缓存结果后每篇文章只需编码一次。
+    
+    Returns:
+        (截断后的内容，内容占用的 token 数)；没有编码器时 token 数按约 4 个字符 1 个 token 估算
+    """
+    encoder = _get_encoder(model)
+    if encoder is not None:
+        tokens = encoder.encode(content, disallowed_special=())
+        if len(tokens) > max_content_tokens:
+            return encoder.decode(tokens[:max_content_tokens]) + "...", max_content_tokens
+        return content, len(tokens)
+    
+    if len(content) > max_content_length:
+        content = content[:max_content_length] + "..."
+    return content, len(content) // 4
+
+
 class PromptBuilder:
     """提示词构建器，负责构建 AI 摘要的提示词"""
     
     @staticmethod
-    def build_summary_prompt(title: str, content: str, max_content_length: int = 2000) -> str:
+    def truncate_content_with_tokens(content: str, max_content_length: int = 2000,
+                                     model: Optional[str] = None,
+                                     max_content_tokens: int = 1200) -> Tuple[str, int]:
+        """
+        限制文章内容长度，避免超出 token 限制，同时返回截断后内容的 token 数
+        
+        有可用的 tiktoken 编码器时按 token 截断，否则按字符截断。
+        
+        Args:
+            content: 文章内容
+            max_content_length: 按字符截断时的最大长度
+            model: 模型名称，用于选择编码器
+            max_content_tokens: 按 token 截断时的最大 token 数
+            
+        Returns:
+            (截断后的内容，token 数)，发生截断时内容以 "..." 结尾
+        """
+        return _truncate_content(content, max_content_length, model, max_content_tokens)
+    
+    @staticmethod
+    def truncate_content(content: str, max_content_length: int = 2000,
+                         model: Optional[str] = None, max_content_tokens: int = 1200) -> str:
+        """
+        限制文章内容长度，避免超出 token 限制
+        
+        Args:
+            content: 文章内容
+            max_content_length: 按字符截断时的最大长度
+            model: 模型名称，用于选择编码器
+            max_content_tokens: 按 token 截断时的最大 token 数
+            
+        Returns:
+            截断后的内容，发生截断时以 "..." 结尾
+        """
+        return _truncate_content(content, max_content_length, model, max_content_tokens)[0]
+    
+    @staticmethod
+    def build_summary_prompt(title: str, content: str, max_content_length: int = 2000,
+                             model: Optional[str] = None, max_content_tokens: int = 1200) -> str:
         """
         构建用于 AI 摘要的提示词
         
         Args:
             title: 文章标题
             content: 文章内容
-            max_content_length: 最大内容长度
+            max_content_length: 按字符截断时的最大内容长度
+            model: 模型名称，指定后按 token 截断内容
+            max_content_tokens: 按 token 截断时的最大 token 数
             
         Returns:
             格式化的提示词
         """
-        # 限制内容长度，避免超出 token 限制
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        content = PromptBuilder.truncate_content(content, max_content_length, model, max_content_tokens)
         
-        return f"""
-                请为以下文章生成一个简洁的中文摘要（200-400 字）：
-
-                标题：{title}
-
-                内容：
-                {content}
-
-                要求：
-                1. 摘要应该概括文章的主要内容和关键信息
-                2. 使用简洁、通俗易懂的中文
-                3. 长度控制在 200-300 字之间
-                4. 突出文章的核心观点或重要信息
-                5. 不要包含"本文"、"文章"等自指性词汇
-                6. 使用列表或段落格式清晰表达
-
-                摘要：
-              """
+        # 摘要要求见 SYSTEM_PROMPT，这里只包含文章本身
+        return f"标题：{title}\n内容：\n{content}"
+    
+    @staticmethod
+    def build_batch_prompt(articles: List[Tuple[str, str]], max_content_length: int = 2000,
+                           model: Optional[str] = None, max_content_tokens: int = 1200) -> str:
+        """
+        构建一次请求内为多篇文章生成摘要的提示词
+        
+        Args:
+            articles: (文章标题，文章内容) 列表，编号从 1 开始
+            max_content_length: 按字符截断时每篇文章的最大内容长度
+            model: 模型名称，指定后按 token 截断内容
+            max_content_tokens: 按 token 截断时每篇文章的最大 token 数
+            
+        Returns:
+            格式化的提示词，配合 BATCH_SYSTEM_PROMPT 要求模型以 JSON 对象返回每篇文章的摘要
+        """
+        article_blocks = []
+        for i, (title, content) in enumerate(articles, 1):
+            # 限制每篇文章的内容长度，避免超出 token 限制
+            content = PromptBuilder.truncate_content(content, max_content_length, model, max_content_tokens)
+            article_blocks.append(f"文章{i}：\n标题：{title}\n内容：\n{content}")
+        
+        # 摘要要求和输出格式见 BATCH_SYSTEM_PROMPT，这里只包含文章本身
+        return "\n\n".join(article_blocks)
 
 
 class SummaryValidator:
     """摘要验证器，负责验证生成的摘要质量"""
     
+    # 常见的错误响应短语，合并为一个忽略大小写的正则，一次扫描完成匹配
+    INVALID_PHRASES = (
+        "抱歉", "无法", "不能", "错误", "失败", 
+        "sorry", "error", "无法生成", "内容不足"
+    )
+    _INVALID_RE = re.compile('|'.join(map(re.escape, INVALID_PHRASES)), re.IGNORECASE)
+    
     @staticmethod
     def is_valid(summary: str, min_length: int = 20) -> bool:
         """
@@ -155,7 +350,7 @@ class SummaryValidator:
         Returns:
             是否为有效摘要
         """
-        if not summary or not summary.strip():
+        if not summary:
             return False
         
         # 检查长度
@@ -163,17 +358,7 @@ class SummaryValidator:
             return False
         
         # 检查是否包含常见的错误响应
-        invalid_phrases = [
-            "抱歉", "无法", "不能", "错误", "失败", 
-            "sorry", "error", "无法生成", "内容不足"
-        ]
-        
-        summary_lower = summary.lower()
-        for phrase in invalid_phrases:
-            if phrase in summary_lower:
-                return False
-        
-        return True
+        return SummaryValidator._INVALID_RE.search(summary) is None
 
 
 class ErrorHandler:
@@ -209,19 +394,27 @@ class ErrorHandler:
 class AISummarizer:
     """AI 文章摘要生成器，主类"""
     
-    def __init__(self, config: AIConfig):
+    # 单次批量请求的估算 token 上限，超过后拆分为新的批次
+    MAX_BATCH_TOKENS = 6000
+    # 同时进行的批量请求数上限
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    def __init__(self, config: AIConfig, console: Console = shared_console):
         """
         初始化 AI 摘要生成器
         
         Args:
             config: AI 配置对象
+            console: 用于输出提示信息的控制台，默认使用全局共享实例
         """
 
-        self.console = Console()
+        self.console = console
         self.config = config
         self.error_handler = ErrorHandler(self.console)
         self.prompt_builder = PromptBuilder()
         self.validator = SummaryValidator()
+        # 服务端是否接受 response_format（JSON 模式），首次被拒绝后不再使用
+        self._json_mode_supported = True
         
         # 验证配置并初始化客户端
         self.enabled = self._initialize_client()
@@ -282,6 +475,183 @@ class AISummarizer:
             self.error_handler.handle_api_error(e)
             return None
     
+    def generate_summaries(self, articles: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """
+        为多篇文章批量生成 AI 摘要，把多篇文章合并到一次 API 请求中
+        
+        批量结果中缺失或未通过质量验证的文章，会退回到逐篇调用 generate_summary。
+        
+        Args:
+            articles: (文章标题，文章内容) 列表
+            
+        Returns:
+            与输入顺序一致的摘要列表，生成失败的位置为 None
+        """
+        summaries: List[Optional[str]] = [None] * len(articles)
+        
+        if not self.enabled:
+            return summaries
+        
+        batches = self._split_batches(articles)
+        if not batches:
+            return summaries
+        
+        # 每个批次都是独立的网络请求，使用线程池并发发送
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(batches))) as executor:
+            for batch_summaries in executor.map(self._summarize_batch, batches):
+                for index, summary in batch_summaries:
+                    summaries[index] = summary
+        
+        return summaries
+    
+    def _summarize_batch(self, batch: List[Tuple[int, str, str]]) -> List[Tuple[int, Optional[str]]]:
+        """
+        为一个批次的文章生成摘要
+        
+        Args:
+            batch: (原始序号，文章标题，文章内容) 列表
+            
+        Returns:
+            (原始序号，摘要) 列表，生成失败的摘要为 None；
+            批量请求本身失败时整批均为 None，只有批量结果中缺失或无效的文章才逐篇重新生成
+        """
+        # 单篇文章无需走批量接口
+        if len(batch) == 1:
+            index, title, content = batch[0]
+            return [(index, self.generate_summary(title, content))]
+        
+        try:
+            batch_results = self._call_batch_api([(title, content) for _, title, content in batch])
+        except Exception as e:
+            # 请求失败（密钥无效、重试后仍被限流等）时逐篇请求同样会失败，不再额外发起 N 次请求
+            self.error_handler.handle_api_error(e)
+            return [(index, None) for index, _, _ in batch]
+        
+        results: List[Tuple[int, Optional[str]]] = []
+        for position, (index, title, content) in enumerate(batch, 1):
+            summary = batch_results.get(position)
+            if not summary or not self.validator.is_valid(summary):
+                summary = self.generate_summary(title, content)
+            results.append((index, summary))
+        return results
+    
+    def _split_batches(self, articles: List[Tuple[str, str]]) -> List[List[Tuple[int, str, str]]]:
+        """
+        按估算的 token 数把文章拆分为多个批次
+        
+        Args:
+            articles: (文章标题，文章内容) 列表
+            
+        Returns:
+            批次列表，每项为 (原始序号，文章标题，文章内容)；内容为空的文章不参与生成
+        """
+        batches: List[List[Tuple[int, str, str]]] = []
+        current: List[Tuple[int, str, str]] = []
+        current_tokens = 0
+        
+        for index, (title, content) in enumerate(articles):
+            if not content or not content.strip():
+                continue
+            
+            tokens = self._estimate_tokens(title, content)
+            if current and current_tokens + tokens > self.MAX_BATCH_TOKENS:
+                batches.append(current)
+                current, current_tokens = [], 0
+            
+            current.append((index, title, content))
+            current_tokens += tokens
+        
+        if current:
+            batches.append(current)
+        return batches
+    
+    def _estimate_tokens(self, title: str, content: str) -> int:
+        """
+        估算一篇文章在提示词中占用的 token 数（内容按提示词中的截断规则计算）
+        
+        内容的 token 数直接取自截断结果，构建提示词时复用同一结果，不再重复编码。
+        
+        Args:
+            title: 文章标题
+            content: 文章内容
+            
+        Returns:
+            估算的 token 数
+        """
+        _, content_tokens = self.prompt_builder.truncate_content_with_tokens(content, model=self.config.model)
+        
+        encoder = _get_encoder(self.config.model)
+        if encoder is not None:
+            return len(encoder.encode(title, disallowed_special=())) + content_tokens
+        
+        # 粗略估算：约 4 个字符对应 1 个 token
+        return len(title) // 4 + content_tokens
+    
+    def _call_batch_api(self, articles: List[Tuple[str, str]]) -> Dict[int, str]:
+        """
+        调用 OpenAI API，在一次请求中为多篇文章生成摘要
+
+        Args:
+            articles: (文章标题，文章内容) 列表
+
+        Returns:
+            Dict[int, str]: 文章编号（从 1 开始）到摘要的映射
+        """
+        prompt = self.prompt_builder.build_batch_prompt(articles, model=self.config.model)
+        request = {
+            "model": self.config.model,
+            "messages": self._build_messages(prompt, BATCH_SYSTEM_PROMPT),
+            "temperature": 0.3,
+        }
+        
+        response = None
+        if self._json_mode_supported:
+            try:
+                response = self.client.chat.completions.create(
+                    **request, response_format={"type": "json_object"}
+                )
+            except BadRequestError:
+                # 部分兼容 OpenAI 接口的服务不支持 response_format，之后的批次不再携带该参数，
+                # 输出格式由 BATCH_SYSTEM_PROMPT 约束，解析失败时照常退回逐篇生成
+                self._json_mode_supported = False
+        if response is None:
+            response = self.client.chat.completions.create(**request)
+        
+        content = response.choices[0].message.content
+        if not content:
+            self.console.print("[yellow]⚠️  API 返回空的批量摘要，改为逐篇生成 [/yellow]")
+            return {}
+        
+        try:
+            data = _json_loads(content)
+        except ValueError:
+            self.console.print("[yellow]⚠️  无法解析批量摘要结果，改为逐篇生成 [/yellow]")
+            return {}
+        
+        results: Dict[int, str] = {}
+        items = data.get("summaries", []) if isinstance(data, dict) else []
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get("summary"), str):
+                continue
+            try:
+                results[int(item.get("id"))] = item["summary"].strip()
+            except (TypeError, ValueError):
+                continue
+        return results
+    
+    def _build_messages(self, prompt: str, system_prompt: str = SYSTEM_PROMPT) -> List[Dict[str, str]]:
+        """构建发送给 API 的对话消息"""
+        return [
+            {
+                "role": "system",
+                "content": system_prompt
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
     def _call_api(self, title: str, content: str) -> Optional[str]:
         """
         调用 OpenAI API 生成摘要
@@ -295,21 +665,12 @@ class AISummarizer:
         """
 
         # 构建提示词
-        prompt = self.prompt_builder.build_summary_prompt(title, content)
+        prompt = self.prompt_builder.build_summary_prompt(title, content, model=self.config.model)
         
         # 调用 API
         response = self.client.chat.completions.create(
             model=self.config.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "你是一个专业的文章摘要助手。请为用户提供的文章生成简洁、准确的中文摘要。"
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
+            messages=self._build_messages(prompt),
             temperature=0.3
         )
         
@@ -2,17 +2,76 @@
 Article management functionality including history storage and pagination.
 """
 
-from typing import Dict, List, Tuple
-import paginate
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from .file_handler import FileHandler
 
 
+@lru_cache(maxsize=4096)
+def normalize_link(link: str) -> str:
+    """
+    生成用于去重的文章链接：去掉 utm_ 开头的跟踪参数并对其余参数排序
+    
+    同一篇文章带不同跟踪参数的链接会得到相同的结果；结果只用作去重的键，文章中保存的仍是原始链接。
+
+    Args:
+        link (str): 文章链接
+
+    Returns:
+        str: 规范化后的链接
+    """
+    # 没有查询参数的链接（最常见的情况）无需解析
+    if '?' not in link:
+        return link
+    
+    parts = urlsplit(link)
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith('utm_')
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
 class ArticleManager:
     """文章管理器，负责文章历史数据的存储、检索和管理"""
     
-    def __init__(self, articles_history_file: str = "articles_history.json"):
+    def __init__(self, articles_history_file: str = "articles_history.json", feed_meta_file: str = "feed_meta.json"):
         self.articles_history_file = articles_history_file
+        self.feed_meta_file = feed_meta_file
         self.file_handler = FileHandler()
+        # 按订阅源缓存已排序的文章列表，翻页时直接切片，无需重新读取和排序
+        self._sorted_articles_cache: Dict[str, List[Dict[str, str]]] = {}
+        # 按订阅源缓存已有文章的链接集合，刷新时判断新文章无需每次重建
+        self._existing_links_cache: Dict[str, Set[str]] = {}
+        # 上面两个缓存所对应的文章历史对象；FileHandler 在文件被外部修改后会返回新的对象，此时缓存作废
+        self._cached_history: Optional[Dict[str, List[Dict]]] = None
+        # 并发刷新时多个线程会同时首次读取文章历史，加锁保证文件只被解析一次、缓存只被构建一次
+        self._history_lock = threading.RLock()
+        # 订阅源元数据在首次使用时加载；并发刷新时会从多个线程写入，需要加锁
+        self._feed_meta: Optional[Dict[str, Dict[str, str]]] = None
+        self._feed_meta_lock = threading.Lock()
+        # 元数据在内存中有未写入文件的修改
+        self._feed_meta_dirty = False
+    
+    def _load_history(self) -> Dict[str, List[Dict]]:
+        """
+        加载文章历史，并在历史对象发生变化时清空按订阅源缓存的排序结果和链接集合
+        
+        FileHandler 按文件的 (修改时间，大小) 缓存解析结果：文件未变化时返回同一个对象，
+        文件被手动编辑或外部同步后返回重新解析的新对象，两层缓存因此保持一致。
+
+        Returns:
+            Dict[str, List[Dict]]: 文章历史字典
+        """
+        with self._history_lock:
+            articles_history = self.file_handler.load_articles_history(self.articles_history_file)
+            if articles_history is not self._cached_history:
+                self._sorted_articles_cache.clear()
+                self._existing_links_cache.clear()
+                self._cached_history = articles_history
+            return articles_history
     
     def _load_and_sort_articles_by_url(self, url: str) -> List[Dict[str, str]]:
         """
@@ -25,21 +84,26 @@ class ArticleManager:
         Returns:
             List[Dict[str, str]]: 按获取时间倒序排列的文章列表
         """
-        # 从 articles_history.json 文件中加载所有订阅源及其文章
-        articles_history = self.file_handler.load_articles_history(self.articles_history_file)
-        # 获取指定 URL 的所有文章
-        all_articles = articles_history.get(url, [])
-        
-        # 按获取时间倒序排列，最新的在前面
-        all_articles.sort(key=lambda x: x.get('fetch_time', ''), reverse=True)
-        
-        return all_articles
+        with self._history_lock:
+            # 从 articles_history.json 文件中加载所有订阅源及其文章（文件未变化时直接返回缓存的对象）
+            articles_history = self._load_history()
+            
+            cached_articles = self._sorted_articles_cache.get(url)
+            if cached_articles is not None:
+                return cached_articles
+            
+            # 获取指定 URL 的所有文章，按获取时间倒序排列，最新的在前面
+            all_articles = sorted(articles_history.get(url, []), key=lambda x: x.get('fetch_time', ''), reverse=True)
+            
+            self._sorted_articles_cache[url] = all_articles
+            return all_articles
     
     def _paginate_articles(self, items: List[Dict[str, str]], page_size: int, page: int) -> Tuple[List[Dict[str, str]], bool, int, int]:
         """
-        使用 paginate 库对项目列表进行分页。
+        对项目列表进行分页。
 
         这是一个通用的分页辅助方法，可以处理任何项目列表。
+        总页数和是否有下一页直接由条目总数计算，只切出当前页的数据。
         
         Args:
             items (List[Dict[str, str]]): 需要分页的项目列表。
@@ -56,12 +120,12 @@ class ArticleManager:
         if not items:
             return [], False, 1, 1
         
-        paginator = paginate.Page(items, page=page, items_per_page=page_size)
-        
-        # 检查是否有下一页：next_page 不为 None 表示有下一页
-        has_next = paginator.next_page is not None
+        # 向上取整得到总页数，并把页码限制在有效范围内
+        total_pages = -(-len(items) // page_size)
+        page = min(max(page, 1), total_pages)
+        start = (page - 1) * page_size
         
-        return paginator.items, has_next, paginator.page, paginator.page_count
+        return items[start:start + page_size], page < total_pages, page, total_pages
     
     def get_paginated_articles(self, url: str, page_size: int = 5, page: int = 1) -> Tuple[List[Dict[str, str]], bool, int, int]:
         """
@@ -81,7 +145,25 @@ class ArticleManager:
         # 2. 分页处理
         return self._paginate_articles(items=all_articles, page_size=page_size, page=page)
     
-    def update_articles_history(self, url: str, new_articles: List[Dict[str, str]]):
+    def get_existing_links(self, url: str) -> Set[str]:
+        """
+        获取订阅源已有文章的链接集合，首次访问时构建并缓存，之后随历史记录的更新增量维护
+
+        Args:
+            url (str): RSS 源链接
+
+        Returns:
+            Set[str]: 已有文章经 normalize_link 规范化后的链接集合（共享对象，调用方不应修改）
+        """
+        with self._history_lock:
+            articles_history = self._load_history()
+            existing_links = self._existing_links_cache.get(url)
+            if existing_links is None:
+                existing_links = {normalize_link(article['link']) for article in articles_history.get(url, [])}
+                self._existing_links_cache[url] = existing_links
+            return existing_links
+    
+    def update_articles_history(self, url: str, new_articles: List[Dict[str, str]]) -> bool:
         """
         将 RSS 订阅源的最新文章添加到历史记录中（纯存储操作）
         
@@ -95,23 +177,113 @@ class ArticleManager:
         Args:
             url (str): RSS 源链接
             new_articles (List[Dict[str, str]]): 新获取的文章列表（可能已包含AI摘要）
+
+        Returns:
+            bool: 保存是否成功（没有需要保存的文章时也返回 True）
         """
+        return self.update_articles_history_many({url: new_articles})
+    
+    def update_articles_history_many(self, new_articles_by_url: Dict[str, List[Dict[str, str]]]) -> bool:
+        """
+        将多个 RSS 订阅源的最新文章一次性添加到历史记录中（纯存储操作）
+        
+        无论涉及多少个订阅源，文章历史文件都只读取和写入一次。
+
+        Args:
+            new_articles_by_url (Dict[str, List[Dict[str, str]]]): RSS 源链接到新文章列表的映射
+
+        Returns:
+            bool: 保存是否成功（没有需要保存的文章时也返回 True）
+        """
+        # 没有任何新文章时无需读取和重写历史文件
+        new_articles_by_url = {url: articles for url, articles in new_articles_by_url.items() if articles}
+        if not new_articles_by_url:
+            return True
+        
         # 从 articles_history.json 文件中加载所有订阅源及其文章
-        articles_history = self.file_handler.load_articles_history(self.articles_history_file)
+        articles_history = self._load_history()
         
-        # 获取目标订阅源的现有文章
-        existing_articles = articles_history.get(url, [])
-        # 创建一个集合用于快速查找现有文章链接
-        existing_links = {article['link'] for article in existing_articles}
+        # 各订阅源本次新增的链接，保存成功后才加入缓存的链接集合
+        added_links_by_url: Dict[str, Set[str]] = {}
         
-        # 只添加新文章（通过链接去重）
-        for article in new_articles:
-            if article['link'] not in existing_links:
-                existing_articles.append(article)
-                existing_links.add(article['link'])
+        for url, new_articles in new_articles_by_url.items():
+            # 获取目标订阅源的现有文章
+            existing_articles = articles_history.setdefault(url, [])
+            # 现有文章的链接集合
+            existing_links = self._existing_links_cache.get(url)
+            if existing_links is None:
+                existing_links = {normalize_link(article['link']) for article in existing_articles}
+                self._existing_links_cache[url] = existing_links
+            added_links = added_links_by_url[url] = set()
+            add_link = added_links.add
+            
+            # 只添加新文章（通过规范化的链接去重，同一批次内的重复链接也只保留第一篇）
+            existing_articles.extend([
+                article for article in new_articles
+                if not ((link := normalize_link(article['link'])) in existing_links
+                        or link in added_links or add_link(link))
+            ])
+        
+        # 保存到文件，并让相关订阅源的排序缓存失效
+        saved = self.file_handler.save_articles_history(self.articles_history_file, articles_history)
+        for url, added_links in added_links_by_url.items():
+            self._sorted_articles_cache.pop(url, None)
+            # 保存失败时不记录这些链接，下次刷新时它们仍会被当作新文章重新保存
+            if saved:
+                self._existing_links_cache[url].update(added_links)
+        return saved
+    
+    def get_feed_meta(self, url: str) -> Dict[str, str]:
+        """
+        获取订阅源的 HTTP 缓存校验信息（etag / modified），用于发起条件请求
+        
+        没有历史文章的订阅源返回空字典，确保至少完整获取一次文章。
 
-        # 更新历史记录
-        articles_history[url] = existing_articles
+        Args:
+            url (str): RSS 源链接
+
+        Returns:
+            Dict[str, str]: 校验信息字典
+        """
+        with self._feed_meta_lock:
+            if self._feed_meta is None:
+                self._feed_meta = self.file_handler.load_feed_meta(self.feed_meta_file)
+            feed_meta = self._feed_meta.get(url, {})
+        
+        if feed_meta and not self._load_and_sort_articles_by_url(url):
+            return {}
+        return feed_meta
+    
+    def update_feed_meta(self, url: str, feed_meta: Dict[str, str]):
+        """
+        更新订阅源的 HTTP 缓存校验信息（只修改内存，由 save_feed_meta 统一写入文件）
+
+        Args:
+            url (str): RSS 源链接
+            feed_meta (Dict[str, str]): 新的校验信息，为空时删除该订阅源的记录
+        """
+        with self._feed_meta_lock:
+            if self._feed_meta is None:
+                self._feed_meta = self.file_handler.load_feed_meta(self.feed_meta_file)
+            if self._feed_meta.get(url, {}) == feed_meta:
+                return
+            
+            if feed_meta:
+                self._feed_meta[url] = feed_meta
+            else:
+                self._feed_meta.pop(url, None)
+            self._feed_meta_dirty = True
+    
+    def save_feed_meta(self):
+        """
+        把有修改的订阅源元数据写入文件，没有修改时不写入
         
-        # 保存到文件
-        self.file_handler.save_articles_history(self.articles_history_file, articles_history)
+        批量刷新时所有订阅源的校验信息只写一次文件。本方法不检查文章是否已保存：
+        调用方应只在订阅源的文章成功保存后才用 update_feed_meta 记录新的校验信息
+        （见 RssParser.fetch_and_save_articles）。
+        """
+        with self._feed_meta_lock:
+            if not self._feed_meta_dirty:
+                return
+            if self.file_handler.save_feed_meta(self.feed_meta_file, self._feed_meta):
+                self._feed_meta_dirty = False
@@ -0,0 +1,9 @@
+"""
+Shared Rich console used by all modules.
+"""
+
+from rich.console import Console
+
+
+# 全局共享的控制台实例：Console 创建时会探测终端能力，各组件复用同一个实例，输出样式也保持一致
+shared_console = Console()
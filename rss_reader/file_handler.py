@@ -3,13 +3,96 @@ File handling operations for JSON data persistence.
 """
 
 import json
+import mmap
 import os
-from typing import Dict, List
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+# orjson 的序列化和解析速度是标准库 json 的数倍；未安装时退回标准库，文件格式保持一致
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，两种实现的解析错误都可以用它捕获
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        """把对象序列化为带 2 空格缩进的 UTF-8 JSON 字节串"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any) -> bytes:
+        """把对象序列化为带 2 空格缩进的 UTF-8 JSON 字节串"""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+    def _loads(data) -> Any:
+        """解析 JSON 字节串（标准库 json 不接受 memoryview，需先转换为 bytes）"""
+        return json.loads(bytes(data))
 
 
 class FileHandler:
     """文件操作处理器，负责 JSON 文件的读写操作"""
     
+    def __init__(self):
+        # 文件名 -> ((修改时间，文件大小)，文章历史)，文件未变化时直接复用，避免重复解析
+        self._articles_history_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, List[Dict]]]] = {}
+    
+    @staticmethod
+    def _atomic_write(filename: str, data: bytes) -> None:
+        """
+        先写入临时文件，再通过 os.replace 原子替换目标文件，避免写入中断导致文件损坏。
+
+        临时文件与目标文件位于同一目录（os.replace 要求在同一文件系统内），文件名唯一，
+        并发写入时互不干扰；写入或替换失败时删除临时文件，不留下残留。
+
+        Args:
+            filename (str): 目标文件名
+            data (bytes): 要写入的内容
+        """
+        tmp_file = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(filename) or ".",
+            prefix=os.path.basename(filename) + ".",
+            suffix=".tmp",
+            delete=False,
+        )
+        try:
+            with tmp_file:
+                tmp_file.write(data)
+                # NamedTemporaryFile 创建的文件权限为 0600，替换已有文件时沿用原文件的权限
+                try:
+                    os.chmod(tmp_file.name, os.stat(filename).st_mode & 0o777)
+                except FileNotFoundError:
+                    pass
+            os.replace(tmp_file.name, filename)
+        except BaseException:
+            os.unlink(tmp_file.name)
+            raise
+    
+    @staticmethod
+    def _read_json(filename: str):
+        """
+        通过 mmap 把文件映射到内存后交给 JSON 解析器，使用 orjson 时省去一次用户态拷贝。
+
+        Args:
+            filename (str): 要读取的 JSON 文件名
+
+        Returns:
+            解析后的 Python 对象
+
+        Raises:
+            JSONDecodeError: 文件为空或内容不是合法的 JSON
+        """
+        with open(filename, "rb") as f:
+            # 空文件无法 mmap，直接交给解析器抛出解析错误
+            if os.fstat(f.fileno()).st_size == 0:
+                return _loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return _loads(view)
+    
     @staticmethod
     def load_subscriptions(filename: str) -> Dict[str, str]:
         """
@@ -26,9 +109,8 @@ class FileHandler:
             return {}
 
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            return FileHandler._read_json(filename)
+        except (JSONDecodeError, FileNotFoundError):
             print(f" 警告：无法解析 {filename} 或文件不存在，将返回空订阅列表。")
             return {}
     
@@ -45,38 +127,52 @@ class FileHandler:
             bool: 保存是否成功
         """
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(subscriptions, f, ensure_ascii=False, indent=2)
+            FileHandler._atomic_write(filename, _dumps(subscriptions))
             return True
         except Exception as e:
             print(f" 保存文件时发生错误：{e}")
             return False
     
     @staticmethod
-    def load_articles_history(filename: str) -> Dict[str, List[Dict]]:
+    def _file_signature(filename: str) -> Tuple[int, int]:
+        """返回文件的 (修改时间，文件大小)，用于判断缓存是否仍然有效"""
+        stat = os.stat(filename)
+        return stat.st_mtime_ns, stat.st_size
+    
+    def load_articles_history(self, filename: str) -> Dict[str, List[Dict]]:
         """
         从 articles_history.json 中加载订阅源的文章。
 
+        文件自上次读取或写入后没有变化时，直接返回缓存的结果。
+        返回的字典会被缓存复用，调用方修改后应通过 save_articles_history 写回。
+
         Args:
             filename (str): 存储文章历史的 JSON 文件名。
 
         Returns:
             Dict[str, List[Dict]]: 一个字典，键是订阅 URL，值是文章列表。
         """
-        if not os.path.exists(filename):
+        try:
+            signature = self._file_signature(filename)
+        except FileNotFoundError:
             return {}
 
+        cached = self._articles_history_cache.get(filename)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+            articles_history = FileHandler._read_json(filename)
+        except (JSONDecodeError, FileNotFoundError):
             print(f" 警告：无法解析 {filename} 或文件不存在，将返回空文章历史。")
             return {}
+
+        self._articles_history_cache[filename] = (signature, articles_history)
+        return articles_history
     
-    @staticmethod
-    def save_articles_history(filename: str, articles_history: Dict[str, List[Dict]]) -> bool:
+    def save_articles_history(self, filename: str, articles_history: Dict[str, List[Dict]]) -> bool:
         """
-        把订阅源的文章保存到 articles_history.json 文件中。
+        把订阅源的文章保存到 articles_history.json 文件中，并同步更新缓存。
 
         Args:
             filename (str): 文件名
@@ -86,9 +182,50 @@ class FileHandler:
             bool: 保存是否成功
         """
         try:
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(articles_history, f, ensure_ascii=False, indent=2)
+            FileHandler._atomic_write(filename, _dumps(articles_history))
+            self._articles_history_cache[filename] = (self._file_signature(filename), articles_history)
             return True
         except Exception as e:
+            # 缓存中的对象可能已被调用方修改但未能写入，丢弃缓存以便下次重新读取文件
+            self._articles_history_cache.pop(filename, None)
             print(f" 保存文章历史时发生错误：{e}")
             return False
+    
+    @staticmethod
+    def load_feed_meta(filename: str) -> Dict[str, Dict[str, str]]:
+        """
+        从 feed_meta.json 中加载各订阅源的 HTTP 缓存校验信息（ETag / Last-Modified）。
+
+        Args:
+            filename (str): 存储订阅源元数据的 JSON 文件名。
+
+        Returns:
+            Dict[str, Dict[str, str]]: 一个字典，键是订阅 URL，值是该订阅源的校验信息。
+        """
+        if not os.path.exists(filename):
+            return {}
+
+        try:
+            return FileHandler._read_json(filename)
+        except (JSONDecodeError, FileNotFoundError):
+            print(f" 警告：无法解析 {filename} 或文件不存在，将返回空的订阅源元数据。")
+            return {}
+    
+    @staticmethod
+    def save_feed_meta(filename: str, feed_meta: Dict[str, Dict[str, str]]) -> bool:
+        """
+        把各订阅源的 HTTP 缓存校验信息保存到 feed_meta.json 文件中。
+
+        Args:
+            filename (str): 文件名
+            feed_meta (Dict[str, Dict[str, str]]): 订阅源元数据字典
+
+        Returns:
+            bool: 保存是否成功
+        """
+        try:
+            FileHandler._atomic_write(filename, _dumps(feed_meta))
+            return True
+        except Exception as e:
+            print(f" 保存订阅源元数据时发生错误：{e}")
+            return False
@@ -11,6 +11,12 @@ class RssApp:
     
     def __init__(self):
         self.ui = UserInterface()
+        # 主菜单选项到处理方法的映射
+        self._actions = {
+            "1": self._handle_add_subscription,
+            "2": self._handle_view_subscriptions,
+            "0": self._handle_exit,
+        }
     
     def run(self):
         """运行应用程序主循环"""
@@ -18,13 +24,9 @@ class RssApp:
             self.ui.show_main_menu()
             choice = self.ui.get_user_input("请选择操作（输入数字）：")
             
-            if choice == "1":
-                self._handle_add_subscription()
-            elif choice == "2":
-                self._handle_view_subscriptions()
-            elif choice == "0":
-                print("感谢使用，再见！")
-                sys.exit(0)
+            handler = self._actions.get(choice)
+            if handler:
+                handler()
             else:
                 print("无效的选择，请输入 1、2 或 0。")
     
@@ -36,6 +38,11 @@ class RssApp:
     def _handle_view_subscriptions(self):
         """处理查看订阅"""
         self.ui.handle_subscriptions_view()
+    
+    def _handle_exit(self):
+        """处理退出程序"""
+        print("感谢使用，再见！")
+        sys.exit(0)
 
 
 def main():
@@ -2,37 +2,307 @@
 RSS parsing and network request handling.
 """
 
+import hashlib
 import html
 import re
-import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice, zip_longest
 from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import feedparser
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
 
-from .article_manager import ArticleManager
-from .ai_summarizer_refactored import create_ai_summarizer_from_config
+from . import __version__
+from .article_manager import ArticleManager, normalize_link
+from .console import shared_console
+from .file_handler import _loads
+
+_WS_RE = re.compile(r'\s+')
+# 只匹配以字母、! / ? 开头的标签，避免把正文中的 "a < b" 之类的比较符号当作标签；
+# 引号内的属性值整体匹配，属性值中的 ">" 不会被当作标签结尾
+_TAG_RE = re.compile(r'''<[A-Za-z!/?](?:[^>"']|"[^"]*"|'[^']*')*>''')
+# script / style 标签连同其内容一起移除
+_SCRIPT_STYLE_RE = re.compile(
+    r'''<(script|style)\b(?:[^>"']|"[^"]*"|'[^']*')*>.*?</\1\s*>''', re.IGNORECASE | re.DOTALL
+)
+# HTML 注释整体移除（注释内容中可能包含 ">"）
+_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+# CDATA 段保留其中的文本
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+# 去除标签后仍残留的标签开头，说明 HTML 不规整（如未闭合的标签），需要交给解析器处理
+_LEFTOVER_TAG_RE = re.compile(r'<[A-Za-z!/?]')
+# 订阅源文档常见的开头（JSON Feed 以 "{" 开头），用于在 Content-Type 不明确时识别内容
+_FEED_PREFIXES = (b'<?xml', b'<rss', b'<feed', b'<rdf', b'{')
+# UTF-16 编码的文档以 BOM 开头，无法按字节前缀识别，交给 feedparser 处理
+_UTF16_BOMS = (b'\xff\xfe', b'\xfe\xff')
+
+# 匹配 RSS 的 </item> 与 Atom 的 </entry>，允许带命名空间前缀；
+# CDATA 段和注释整体匹配后跳过，其中展示的 "</item>" 等标记不会被当作条目结尾
+_ENTRY_END_RE = re.compile(rb'<!\[CDATA\[.*?\]\]>|<!--.*?-->|</(?:[\w-]+:)?(?:item|entry)\s*>', re.DOTALL)
+
+
+def _is_json_feed(data: bytes) -> bool:
+    """根据内容开头判断是否为 JSON Feed（跳过 UTF-8 BOM 和空白字符）"""
+    return data[:64].lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'{')
+
+
+def _parse_json_feed(data: bytes) -> feedparser.FeedParserDict:
+    """
+    解析 JSON Feed（https://jsonfeed.org），转换为与 feedparser 相同结构的结果
+
+    当前使用的 feedparser 6.0 不支持 JSON Feed，这里只转换阅读器用到的字段：
+    频道标题，以及条目的 title / link / summary / published。
+
+    Args:
+        data (bytes): 订阅源原始内容
+
+    Returns:
+        feedparser.FeedParserDict: 解析结果，内容不是合法的 JSON Feed 时 bozo 为 True
+    """
+    result = feedparser.FeedParserDict(bozo=False, feed=feedparser.FeedParserDict(), entries=[])
+    # 与文章历史等 JSON 文件使用同一个解析函数（优先 orjson）；orjson 不接受 BOM，需先去掉
+    if data.startswith(b'\xef\xbb\xbf'):
+        data = data[3:]
+    try:
+        document = _loads(data)
+    except ValueError as e:
+        result['bozo'] = True
+        result['bozo_exception'] = e
+        return result
+    
+    if not isinstance(document, dict) or not isinstance(document.get('items'), list):
+        result['bozo'] = True
+        result['bozo_exception'] = ValueError("不是有效的 JSON Feed：缺少 items 列表")
+        return result
+    
+    if document.get('title'):
+        result['feed']['title'] = str(document['title'])
+    
+    for item in document['items']:
+        if not isinstance(item, dict):
+            continue
+        entry = feedparser.FeedParserDict()
+        if item.get('title'):
+            entry['title'] = str(item['title'])
+        link = item.get('url') or item.get('external_url')
+        if link:
+            entry['link'] = str(link)
+        # 摘要优先使用 summary，其次是 HTML 正文；纯文本正文先转义，与 HTML 摘要一样交给 _clean_html_text 处理
+        if item.get('summary'):
+            entry['summary'] = str(item['summary'])
+        elif item.get('content_html'):
+            entry['summary'] = str(item['content_html'])
+        elif item.get('content_text'):
+            entry['summary'] = html.escape(str(item['content_text']), quote=False)
+        if item.get('date_published'):
+            entry['published'] = str(item['date_published'])
+        result['entries'].append(entry)
+    return result
+
+
+def _parse_feed(data: bytes) -> feedparser.FeedParserDict:
+    """
+    解析订阅源内容
+
+    摘要在 _clean_html_text 中会被转换为纯文本，因此关闭 feedparser 自带的 HTML 清理和
+    正文内相对链接的解析，避免对每个条目的 HTML 做两遍处理（条目自身的链接仍会被解析为绝对地址）。
+    
+    关闭清理的前提是 _clean_html_text 能正确处理发布者的原始 HTML：属性值中的 ">"、注释、CDATA、
+    script / style 都由其中的正则处理，不规整的 HTML 交给 BeautifulSoup；修改那里的正则时需保持这一点。
+    标题等其他字段在界面中按纯文本显示（经过 rich.markup.escape），不受影响。
+
+    Args:
+        data (bytes): 订阅源原始内容
+
+    Returns:
+        feedparser.FeedParserDict: 解析结果
+    """
+    if _is_json_feed(data):
+        return _parse_json_feed(data)
+    return feedparser.parse(data, sanitize_html=False, resolve_relative_uris=False)
+
+
+@lru_cache(maxsize=1024)
+def _clean_html_text(text: str) -> str:
+    """
+    清理 HTML 标签，保留文本内容
+
+    结果只取决于输入文本，刷新时重复出现的条目摘要直接复用缓存的结果。
+
+    Args:
+        text (str): 可能包含 HTML 的文本
+
+    Returns:
+        str: 纯文本内容
+    """
+    if not text:
+        return text
+    
+    # 不含标签的纯文本无需任何处理，直接反转义并清理空白字符
+    if '<' not in text:
+        return _WS_RE.sub(' ', html.unescape(text)).strip()
+    
+    # 先移除注释，并把 CDATA 段替换为转义后的文本（最后统一反转义），其中的 "<" 不会被当作标签
+    text = _COMMENT_RE.sub('', text)
+    if '<![CDATA[' in text:
+        text = _CDATA_RE.sub(lambda match: html.escape(match.group(1), quote=False), text)
+    
+    # 常见的规整 HTML 直接用预编译的正则去除标签，比构建解析树快一个数量级
+    stripped = _TAG_RE.sub('', _SCRIPT_STYLE_RE.sub('', text))
+    if not _LEFTOVER_TAG_RE.search(stripped):
+        return _WS_RE.sub(' ', html.unescape(stripped)).strip()
+    
+    try:
+        # 不规整的 HTML 使用 BeautifulSoup 解析。这里只处理正则无法处理的输入，使用 html.parser 而不是 lxml：
+        # lxml 会丢弃 "if a<b then c" 中 "<b" 之后的文本，html.parser 则保留为普通文本
+        soup = BeautifulSoup(text, 'html.parser')
+        
+        # 移除 script 和 style 标签
+        for script in soup(["script", "style"]):
+            script.decompose()
+        
+        # 获取纯文本
+        clean_text = soup.get_text()
+        
+        # 清理多余的空白字符
+        clean_text = _WS_RE.sub(' ', clean_text)
+        clean_text = html.unescape(clean_text)
+        
+        return clean_text.strip()
+    except Exception:
+        # 如果 BeautifulSoup 解析失败，使用正则去除标签的结果
+        return _WS_RE.sub(' ', html.unescape(stripped)).strip()
 
 
 class RssParser:
     """RSS 解析器，负责网络请求和 RSS 源解析"""
     
-    def __init__(self, article_manager: ArticleManager, ai_summarizer=None, timeout: int = 10, enable_ai_summary: bool = True):
+    # 已解析条目的缓存有效期（秒），同一会话内短时间重复进入订阅时无需重新下载和解析
+    ENTRIES_CACHE_TTL = 60
+    # 已解析条目缓存的最大订阅源数，超出时淘汰最久未使用的订阅源
+    ENTRIES_CACHE_SIZE = 32
+    # 批量刷新多个订阅源时的最大并发下载数
+    MAX_FETCH_WORKERS = 8
+    # 单个订阅源允许下载的最大字节数，避免异常的超大响应占满内存
+    MAX_FEED_BYTES = 10 * 1024 * 1024
+    # 连接池大小，不小于并发下载数，避免并发刷新时连接被丢弃后重新建立
+    POOL_SIZE = 20
+    
+    def __init__(self, article_manager: ArticleManager, ai_summarizer=None, timeout: int = 10, enable_ai_summary: bool = True, console: Console = shared_console):
         self.timeout = timeout
-        self.console = Console()
+        self.console = console
         self.article_manager = article_manager
         self.enable_ai_summary = enable_ai_summary
+        # URL -> (缓存时间，feedparser 解析出的条目列表，是否包含全部条目)
+        # 按最近使用顺序淘汰；并发刷新时会从多个线程访问，需要加锁
+        self._entries_cache: "OrderedDict[str, Tuple[float, list, bool]]" = OrderedDict()
+        self._entries_cache_lock = threading.Lock()
+        # 复用同一个会话，保持 keep-alive 连接，避免每次请求都重新进行 TCP/TLS 握手
+        self._session = self._create_session()
+        
+        # 使用传入的 AI 摘要器；没有传入时在首次使用时才创建，只获取订阅信息时无需初始化 AI 服务
+        self._ai_summarizer = ai_summarizer
+        self._ai_summarizer_ready = ai_summarizer is not None
+    
+    @property
+    def ai_summarizer(self):
+        """AI 摘要器，未传入时在首次访问时根据配置文件创建；未启用 AI 摘要或配置无效时为 None"""
+        if not self._ai_summarizer_ready:
+            ai_summarizer = None
+            if self.enable_ai_summary:
+                # 导入 AI 摘要模块会连带导入 openai（占 import rss_reader 耗时的大部分），推迟到首次需要摘要时
+                from .ai_summarizer_refactored import create_ai_summarizer_from_config
+                try:
+                    ai_summarizer = create_ai_summarizer_from_config()
+                except ValueError as e:
+                    # 配置无效（如 timeout 或 max_retries 不是数字）时只提示一次，本次会话不再使用 AI 摘要，
+                    # 避免异常传到调用方后被当作其他输入错误处理
+                    print(f" ⚠️ AI 摘要配置无效，已停用 AI 摘要：{e}")
+            self._ai_summarizer = ai_summarizer
+            self._ai_summarizer_ready = True
+        return self._ai_summarizer
+    
+    @ai_summarizer.setter
+    def ai_summarizer(self, ai_summarizer):
+        self._ai_summarizer = ai_summarizer
+        self._ai_summarizer_ready = True
+    
+    def _create_session(self) -> requests.Session:
+        """
+        创建带连接池和自动重试的 HTTP 会话
+        
+        连接错误和服务端错误（500/502/503/504）按指数退避最多重试 3 次；
+        重试用尽后仍返回最后一次的响应，由调用方的 raise_for_status 统一处理。
+
+        Returns:
+            requests.Session: 配置好的会话
+        """
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE, max_retries=retry)
+        
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # 标识客户端身份（部分站点会拒绝默认的 python-requests UA），并请求压缩传输以减少下载量
+        session.headers.update({
+            'User-Agent': f'rss-reader/{__version__}',
+            'Accept-Encoding': 'gzip, deflate',
+        })
+        return session
+    
+    def close(self):
+        """关闭底层 HTTP 会话，释放连接池"""
+        self._session.close()
+    
+    def __enter__(self) -> 'RssParser':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _read_body(self, response: requests.Response) -> Optional[bytes]:
+        """
+        分块读取流式响应的内容，超过 MAX_FEED_BYTES 时放弃下载
+
+        Args:
+            response (requests.Response): 以 stream=True 发起的 HTTP 响应
+
+        Returns:
+            Optional[bytes]: 响应内容，超过大小限制时返回 None
+        """
+        limit_mb = self.MAX_FEED_BYTES // (1024 * 1024)
         
-        # 使用传入的 AI 摘要器，如果没有传入则创建新的
-        if ai_summarizer is not None:
-            self.ai_summarizer = ai_summarizer
-        elif self.enable_ai_summary:
-            self.ai_summarizer = create_ai_summarizer_from_config()
-        else:
-            self.ai_summarizer = None
+        # 服务器声明的长度已超过限制时，无需开始下载
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > self.MAX_FEED_BYTES:
+            print(f" ⚠️ 订阅源内容超过 {limit_mb} MB，已放弃下载")
+            return None
+        
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            size += len(chunk)
+            if size > self.MAX_FEED_BYTES:
+                print(f" ⚠️ 订阅源内容超过 {limit_mb} MB，已放弃下载")
+                return None
+            chunks.append(chunk)
+        return b"".join(chunks)
     
     def fetch_feed_info(self, url: str) -> Tuple[Optional[str], bool]:
         """
@@ -46,21 +316,26 @@ class RssParser:
         """
         try:
             print(f"正在请求链接：{url}")
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            with self._session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                body = self._read_body(response)
+            if body is None:
+                return None, False
 
-            feed = feedparser.parse(response.content)
+            # 只需要频道标题，裁掉第一个条目之后的内容再解析；裁剪后解析异常或没有标题时，回退为解析完整内容
+            truncated_body, truncated = self._truncate_entries(body, 1)
+            feed = _parse_feed(truncated_body)
+            if truncated and (feed.bozo or not feed.feed.get('title')):
+                feed = _parse_feed(body)
             
             if feed.bozo:
-                print(f" 警告：链接 {url} 可能不是一个有效的 RSS/Atom 源。错误：{feed.bozo_exception}")
+                print(f" 警告：链接 {url} 可能不是一个有效的 RSS/Atom/JSON Feed 源。错误：{feed.bozo_exception}")
 
             title = getattr(feed.feed, 'title', None) if hasattr(feed, 'feed') else None
             if not title:
                 print(" 无法从链接中获取标题，将使用默认名称。")
-                # 添加微秒级时间戳和随机数，确保名称唯一性
-                timestamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
-                random_suffix = random.randint(1000, 9999)
-                title = f"未命名订阅_{timestamp}_{random_suffix}"
+                # 添加随机 UUID 片段，确保名称唯一性
+                title = f"未命名订阅_{uuid.uuid4().hex[:12]}"
             
             print(f"成功获取标题：{title}")
             return title, True
@@ -84,70 +359,253 @@ class RssParser:
             print(" ❓ 处理订阅时发生未知错误，请稍后重试")
             return None, False
     
-    def fetch_articles(self, url: str, count: int = 3) -> List[Dict[str, str]]:
+    @staticmethod
+    def _looks_like_feed(content_type: str, body: bytes) -> bool:
+        """
+        根据 Content-Type 和内容开头判断响应是否可能是 RSS/Atom/JSON Feed 订阅源，避免对空内容或 HTML 错误页调用 feedparser
+
+        Args:
+            content_type (str): 响应的 Content-Type
+            body (bytes): 响应内容
+
+        Returns:
+            bool: 是否可能是订阅源
+        """
+        if not body:
+            return False
+        
+        content_type = content_type.lower()
+        # JSON Feed 的类型为 application/feed+json，部分服务器也会返回 application/json
+        if 'xml' in content_type or 'rss' in content_type or 'atom' in content_type or 'json' in content_type:
+            return True
+        
+        if body.startswith(_UTF16_BOMS):
+            return True
+        head = body[:512].lstrip(b'\xef\xbb\xbf \t\r\n').lower()
+        return head.startswith(_FEED_PREFIXES)
+    
+    def _get_cached_entries(self, url: str, count: int) -> Optional[list]:
+        """
+        获取缓存中仍在有效期内的已解析条目
+
+        Args:
+            url (str): RSS 源链接
+            count (int): 需要的条目数量
+
+        Returns:
+            Optional[list]: 缓存的条目列表，未命中、已过期或缓存的条目不足时返回 None
+        """
+        with self._entries_cache_lock:
+            cached = self._entries_cache.get(url)
+            if cached is None:
+                return None
+            
+            cached_at, entries, complete = cached
+            if time.monotonic() - cached_at >= self.ENTRIES_CACHE_TTL:
+                del self._entries_cache[url]
+                return None
+            self._entries_cache.move_to_end(url)
+        
+        if not complete and len(entries) < count:
+            return None
+        return entries
+    
+    def _store_entries(self, url: str, entries: list, complete: bool):
+        """
+        缓存已解析的条目，超过 ENTRIES_CACHE_SIZE 时淘汰最久未使用的订阅源
+
+        Args:
+            url (str): RSS 源链接
+            entries (list): feedparser 解析出的条目列表
+            complete (bool): 是否包含订阅源的全部条目
+        """
+        with self._entries_cache_lock:
+            self._entries_cache[url] = (time.monotonic(), entries, complete)
+            self._entries_cache.move_to_end(url)
+            if len(self._entries_cache) > self.ENTRIES_CACHE_SIZE:
+                self._entries_cache.popitem(last=False)
+    
+    def _truncate_entries(self, body: bytes, count: int) -> Tuple[bytes, bool]:
+        """
+        只保留前 count 个条目，在交给 feedparser 之前裁掉其余条目
+        
+        保留文档开头的频道信息和最后一个条目之后的闭合标签，裁剪后仍是结构完整的 XML，
+        feedparser 的解析耗时因此只与 count 相关，而不是与订阅源的条目总数相关。
+        位于被裁掉的条目之间的频道信息（如 Atom 中写在条目之后的 <title>）会丢失，
+        调用方在解析结果异常或缺少所需信息时应回退为解析完整内容。
+
+        Args:
+            body (bytes): 订阅源原始内容
+            count (int): 需要保留的条目数量
+
+        Returns:
+            Tuple[bytes, bool]: (裁剪后的内容，是否发生了裁剪)
+        """
+        # JSON Feed 没有 XML 条目标签，不做裁剪
+        if _is_json_feed(body):
+            return body, False
+        
+        nth_end = None
+        last_end = None
+        i = 0
+        for match in _ENTRY_END_RE.finditer(body):
+            if body[match.start() + 1] == 0x21:  # "!"：CDATA 段或注释
+                continue
+            i += 1
+            if i == count:
+                nth_end = match.end()
+            last_end = match.end()
+        
+        if nth_end is None or nth_end == last_end:
+            return body, False
+        return body[:nth_end] + body[last_end:], True
+    
+    def _conditional_headers(self, feed_meta: Dict[str, str]) -> Dict[str, str]:
+        """
+        根据上次保存的 ETag / Last-Modified 构建条件请求头
+
+        Args:
+            feed_meta (Dict[str, str]): 订阅源的校验信息
+
+        Returns:
+            Dict[str, str]: 请求头字典，没有校验信息时为空
+        """
+        headers = {}
+        if feed_meta.get('etag'):
+            headers['If-None-Match'] = feed_meta['etag']
+        if feed_meta.get('modified'):
+            headers['If-Modified-Since'] = feed_meta['modified']
+        return headers
+    
+    @staticmethod
+    def _validators_from_response(response: requests.Response, digest: str) -> Dict[str, str]:
+        """
+        提取响应中的 ETag / Last-Modified 和响应内容的摘要，供下次请求使用
+
+        Args:
+            response (requests.Response): 成功的 HTTP 响应
+            digest (str): 响应内容的摘要
+
+        Returns:
+            Dict[str, str]: 校验信息字典
+        """
+        feed_meta = {}
+        if response.headers.get('ETag'):
+            feed_meta['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            feed_meta['modified'] = response.headers['Last-Modified']
+        feed_meta['digest'] = digest
+        return feed_meta
+    
+    def fetch_articles(self, url: str, count: int = 3, use_cache: bool = True) -> List[Dict[str, str]]:
         """
         获取 RSS 源的最新文章（纯获取功能，不涉及数据持久化）
 
         Args:
             url (str): RSS 源链接
             count (int): 获取文章数量
+            use_cache (bool): 是否使用会话内缓存的解析结果，强制刷新时传入 False
 
         Returns:
             List[Dict[str, str]]: 文章列表
         """
+        return self._fetch_articles_with_validators(url, count, use_cache)[0]
+    
+    def _fetch_articles_with_validators(self, url: str, count: int = 3,
+                                        use_cache: bool = True) -> Tuple[List[Dict[str, str]], Optional[Dict[str, str]]]:
+        """
+        获取 RSS 源的最新文章，同时返回本次响应的校验信息（不写入订阅源元数据）
+        
+        校验信息由调用方在文章保存成功后再通过 update_feed_meta 记录：如果先记录而文章没有保存，
+        下次请求会得到 304 或相同的内容摘要而被跳过，这些文章就再也不会被保存。
+
+        Args:
+            url (str): RSS 源链接
+            count (int): 获取文章数量
+            use_cache (bool): 是否使用会话内缓存的解析结果，强制刷新时传入 False
+
+        Returns:
+            Tuple[List[Dict[str, str]], Optional[Dict[str, str]]]: (文章列表，校验信息)；
+                使用缓存、未发起请求或请求失败时校验信息为 None
+        """
+        validators = None
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
+            entries = self._get_cached_entries(url, count) if use_cache else None
+            if entries is None:
+                feed_meta = self.article_manager.get_feed_meta(url)
+                headers = self._conditional_headers(feed_meta)
+                with self._session.get(url, timeout=self.timeout, headers=headers, stream=True) as response:
+                    # 订阅源自上次获取后没有变化，无需下载和解析
+                    if response.status_code == 304:
+                        return [], None
+                    response.raise_for_status()
+                    body = self._read_body(response)
+                if body is None:
+                    return [], None
+                
+                # 空内容或明显不是订阅源的页面（如 HTML 错误页）无需解析
+                if not self._looks_like_feed(response.headers.get('Content-Type', ''), body):
+                    print(f" 警告：链接 {url} 返回的内容不是 RSS/Atom/JSON Feed 订阅源。")
+                    return [], None
+                
+                # 服务器不支持条件请求时，内容与上次完全相同也说明没有变化，无需解析
+                digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+                validators = self._validators_from_response(response, digest)
+                if feed_meta.get('digest') == digest:
+                    return [], validators
 
-            feed = feedparser.parse(response.content)
+                # 只解析需要的前 count 个条目；裁剪后的文档解析异常或条目数不足时，回退为解析完整内容
+                truncated_body, truncated = self._truncate_entries(body, count)
+                feed = _parse_feed(truncated_body)
+                if truncated and (feed.bozo or len(feed.entries) < count):
+                    feed = _parse_feed(body)
+                    truncated = False
+                entries = feed.entries
+                self._store_entries(url, entries, not truncated)
 
-            if not feed.entries:
+            if not entries:
                 print(f" 警告：链接 {url} 没有找到任何文章。")
-                return []
-
-            # 获取新文章
-            new_articles = []
-            for entry in feed.entries[:count]:
-                # 基础文章信息
-                title = str(entry.get("title", "无标题"))
-                link = str(entry.get("link", "无链接"))
-                summary_raw = entry.get("summary", "无摘要")
-                original_summary = self._clean_html(str(summary_raw) if summary_raw else "无摘要")
-                published = str(entry.get("published", ""))
-                fetch_time = datetime.now().isoformat()
-                
-                # 注意：AI摘要的生成已移到 _enhance_articles_with_ai 方法中
-                # 在 fetch_and_save_articles 流程中进行AI增强处理
-                article = {
-                    'title': title,
-                    'link': link,
-                    'summary': original_summary,
+                return [], validators
+
+            # 获取新文章（只处理需要的前 count 个条目；推导式内用到的函数预先绑定为局部变量）
+            clean_html = self._clean_html
+            # 同一次获取的文章共用同一个获取时间
+            fetch_time = datetime.now().isoformat()
+            
+            # 注意：AI摘要的生成已移到 _enhance_articles_with_ai 方法中
+            # 在 fetch_and_save_articles 流程中进行AI增强处理
+            new_articles = [
+                {
+                    'title': str(entry.get("title", "无标题")),
+                    'link': str(entry.get("link", "无链接")),
+                    'summary': clean_html(str(entry.get("summary") or "无摘要")),
                     'ai_summary': None,  # 新文章先设为None，稍后进行AI增强时生成
-                    'published': published,
+                    'published': str(entry.get("published", "")),
                     'fetch_time': fetch_time
                 }
-                new_articles.append(article)
+                for entry in islice(entries, count)
+            ]
             
-            return new_articles
+            return new_articles, validators
 
         except requests.exceptions.SSLError:
             print(" ❌ SSL 连接错误：无法建立安全连接，可能是网站证书问题")
-            return []
+            return [], None
         except requests.exceptions.Timeout:
             print(" ⏰ 连接超时：网络响应过慢，请稍后重试")
-            return []
+            return [], None
         except requests.exceptions.ConnectionError:
             print(" 🌐 连接错误：无法连接到服务器，请检查网络连接")
-            return []
+            return [], None
         except requests.exceptions.HTTPError as e:
             print(f" 🚫 HTTP 错误：服务器返回错误状态码 {e.response.status_code}")
-            return []
+            return [], None
         except requests.exceptions.RequestException as e:
             print(" 📡 网络请求失败：连接或传输过程中发生问题")
-            return []
+            return [], None
         except Exception as e:
             print(" ❓ 处理文章时发生未知错误，请稍后重试")
-            return []
+            return [], None
     
     def _enhance_articles_with_ai(self, articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
@@ -164,58 +622,153 @@ class RssParser:
         Returns:
             List[Dict[str, str]]: AI增强后的文章列表
         """
-        enhanced_articles = []
+        # AI 服务不可用时直接返回原始文章，无需检查每篇文章
+        ai_summarizer = self.ai_summarizer
+        if not (ai_summarizer and ai_summarizer.is_enabled()):
+            return articles
         
-        for article in articles:
-            # 生成AI摘要（如果需要且可用）
-            if not article.get('ai_summary') and self.ai_summarizer and self.ai_summarizer.is_enabled():
-                print(f"  正在为文章「{article['title']}」生成 AI 摘要...")
-                ai_summary = self.ai_summarizer.generate_summary(article['title'], article['summary'])
+        # 为尚未生成摘要的文章批量生成AI摘要
+        pending_articles = [article for article in articles if not article.get('ai_summary')]
+        if pending_articles:
+            print(f"  正在为 {len(pending_articles)} 篇文章生成 AI 摘要...")
+            ai_summaries = ai_summarizer.generate_summaries(
+                [(article['title'], article['summary']) for article in pending_articles]
+            )
+            for article, ai_summary in zip(pending_articles, ai_summaries):
                 if ai_summary:
                     article['ai_summary'] = ai_summary
-                    print(f"  ✅ AI 摘要生成成功")
+                    print(f"  ✅ 文章「{article['title']}」AI 摘要生成成功")
                 else:
-                    print(f"  ⚠️ AI 摘要生成失败，将使用原始摘要")
-            
-            # 未来可以在这里添加更多AI增强功能：
-            # article = self._extract_keywords(article)
-            # article = self._classify_article(article)
-            
-            enhanced_articles.append(article)
+                    print(f"  ⚠️ 文章「{article['title']}」AI 摘要生成失败，将使用原始摘要")
+        
+        # 未来可以在这里添加更多AI增强功能：
+        # articles = self._extract_keywords(articles)
+        # articles = self._classify_articles(articles)
         
-        return enhanced_articles
+        return articles
     
-    def fetch_and_save_articles(self, url: str, count: int = 3) -> List[Dict[str, str]]:
+    def fetch_and_save_articles(self, url: str, count: int = 3, use_cache: bool = True) -> List[Dict[str, str]]:
         """
         获取 RSS 源的最新文章，进行AI增强处理，然后保存到历史记录
 
         Args:
             url (str): RSS 源链接
             count (int): 获取文章数量
+            use_cache (bool): 是否使用会话内缓存的解析结果
 
         Returns:
             List[Dict[str, str]]: 文章列表
         """
         # 1. 获取原始文章
-        new_articles = self.fetch_articles(url, count)
+        new_articles, validators = self._fetch_articles_with_validators(url, count, use_cache=use_cache)
+        
+        # 2. 识别真正的新文章，进行AI增强，再保存
+        enhanced_new_articles = self._prepare_new_articles(url, new_articles)
+        # 保存到历史记录（ArticleManager只负责存储）
+        saved = self.article_manager.update_articles_history(url, enhanced_new_articles)
+        
+        # 3. 文章保存成功后才记录并写入校验信息；保存失败或上面的步骤抛出异常时保留原来的校验信息
+        if saved and validators is not None:
+            self.article_manager.update_feed_meta(url, validators)
+        self.article_manager.save_feed_meta()
+        
+        return new_articles
+    
+    def fetch_and_save_many(self, urls: List[str], count: int = 3, use_cache: bool = True) -> Dict[str, List[Dict[str, str]]]:
+        """
+        并发获取多个 RSS 源的最新文章，然后统一进行AI增强处理并保存到历史记录
         
-        # 2. 如果获取成功，识别真正的新文章，进行AI增强，再保存
-        if new_articles:
-            # 识别哪些是真正的新文章（避免对已存在的文章重复处理）
+        下载是主要耗时，使用线程池并发请求，总耗时接近最慢的单个订阅源；
+        单个订阅源失败只会得到空列表，不会中断其他订阅源。
+
+        Args:
+            urls (List[str]): RSS 源链接列表
+            count (int): 每个订阅源获取的文章数量
+            use_cache (bool): 是否使用会话内缓存的解析结果
+
+        Returns:
+            Dict[str, List[Dict[str, str]]]: RSS 源链接到文章列表的映射
+        """
+        if not urls:
+            return {}
+        
+        # 1. 并发获取原始文章（_fetch_articles_with_validators 内部已处理所有异常）
+        #    按主机轮流排列请求顺序，避免同时向同一个站点发起大量请求而触发限流
+        ordered_urls = self._interleave_by_host(urls)
+        with ThreadPoolExecutor(max_workers=min(self.MAX_FETCH_WORKERS, len(urls))) as executor:
+            fetched = dict(zip(ordered_urls, executor.map(
+                lambda url: self._fetch_articles_with_validators(url, count, use_cache=use_cache), ordered_urls
+            )))
+        # 结果保持调用方传入的顺序
+        results = {url: fetched[url][0] for url in urls}
+        
+        # 2. 依次识别各订阅源真正的新文章
+        new_articles_by_url = {}
+        for url, new_articles in results.items():
             truly_new_articles = self._filter_new_articles(url, new_articles)
-            
-            # 只对真正的新文章进行AI增强处理
             if truly_new_articles:
-                enhanced_new_articles = self._enhance_articles_with_ai(truly_new_articles)
-                
-                # 保存到历史记录（ArticleManager只负责存储）
-                self.article_manager.update_articles_history(url, enhanced_new_articles)
+                new_articles_by_url[url] = truly_new_articles
         
-        return new_articles
+        if new_articles_by_url:
+            # 3. 所有订阅源的新文章合并进行AI增强，可以共用批量摘要请求
+            self._enhance_articles_with_ai(
+                [article for articles in new_articles_by_url.values() for article in articles]
+            )
+        
+        # 4. 所有订阅源的新文章一次性写入历史记录
+        saved = self.article_manager.update_articles_history_many(new_articles_by_url)
+        
+        # 5. 文章保存成功后才记录校验信息，并一次性写入；保存失败时只记录没有新文章的订阅源
+        for url, (_, validators) in fetched.items():
+            if validators is not None and (saved or url not in new_articles_by_url):
+                self.article_manager.update_feed_meta(url, validators)
+        self.article_manager.save_feed_meta()
+        
+        return results
+    
+    @staticmethod
+    def _interleave_by_host(urls: List[str]) -> List[str]:
+        """
+        按主机分组后轮流取出链接，使相邻的请求尽量指向不同的站点
+
+        Args:
+            urls (List[str]): RSS 源链接列表
+
+        Returns:
+            List[str]: 重新排列后的链接列表（去除重复链接）
+        """
+        urls_by_host: Dict[str, List[str]] = {}
+        for url in dict.fromkeys(urls):
+            urls_by_host.setdefault(urlsplit(url).netloc.lower(), []).append(url)
+        
+        interleaved = chain.from_iterable(zip_longest(*urls_by_host.values()))
+        return [url for url in interleaved if url is not None]
+    
+    def _prepare_new_articles(self, url: str, articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        从获取到的文章中识别真正的新文章，并进行AI增强
+
+        Args:
+            url (str): RSS 源链接
+            articles (List[Dict[str, str]]): 获取到的文章列表
+
+        Returns:
+            List[Dict[str, str]]: AI增强后的新文章列表，没有新文章时为空列表
+        """
+        if not articles:
+            return []
+        
+        # 识别哪些是真正的新文章（避免对已存在的文章重复处理）
+        truly_new_articles = self._filter_new_articles(url, articles)
+        
+        # 只对真正的新文章进行AI增强处理
+        if not truly_new_articles:
+            return []
+        return self._enhance_articles_with_ai(truly_new_articles)
     
     def _filter_new_articles(self, url: str, articles: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
-        过滤出真正的新文章（基于链接去重）
+        过滤出真正的新文章（基于规范化后的链接去重）
         
         Args:
             url (str): RSS源链接
@@ -224,45 +777,15 @@ class RssParser:
         Returns:
             List[Dict[str, str]]: 真正的新文章列表
         """
-        # 获取现有文章的链接集合
-        articles_history = self.article_manager.file_handler.load_articles_history(
-            self.article_manager.articles_history_file
-        )
-        existing_articles = articles_history.get(url, [])
-        existing_links = {article['link'] for article in existing_articles}
+        if not articles:
+            return []
         
-        # 只返回链接不存在的新文章
-        new_articles = []
-        for article in articles:
-            if article['link'] not in existing_links:
-                new_articles.append(article)
+        # 获取现有文章的链接集合（由 ArticleManager 缓存并增量维护）
+        existing_links = self.article_manager.get_existing_links(url)
         
-        return new_articles
+        # 只返回链接不存在的新文章（去掉跟踪参数后再比较）
+        return [article for article in articles if normalize_link(article['link']) not in existing_links]
     
     def _clean_html(self, text: str) -> str:
-        """使用 BeautifulSoup 清理 HTML 标签，保留文本内容"""
-        if not text:
-            return text
-        
-        try:
-            # 使用 BeautifulSoup 解析 HTML
-            soup = BeautifulSoup(text, 'html.parser')
-            
-            # 移除 script 和 style 标签
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # 获取纯文本
-            clean_text = soup.get_text()
-            
-            # 清理多余的空白字符
-            clean_text = re.sub(r'\s+', ' ', clean_text)
-            clean_text = html.unescape(clean_text)
-            
-            return clean_text.strip()
-        except Exception:
-            # 如果 BeautifulSoup 解析失败，回退到原始方法
-            clean_text = re.sub(r'<[^>]+>', '', text)
-            clean_text = re.sub(r'\s+', ' ', clean_text)
-            clean_text = html.unescape(clean_text)
-            return clean_text.strip()
+        """清理 HTML 标签，保留文本内容"""
+        return _clean_html_text(text)
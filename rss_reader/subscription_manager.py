@@ -2,10 +2,12 @@
 Subscription management functionality.
 """
 
-from typing import Dict, Optional, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 
+from .console import shared_console
 from .file_handler import FileHandler
 from .article_manager import ArticleManager
 from .rss_parser import RssParser
@@ -14,12 +16,61 @@ from .rss_parser import RssParser
 class SubscriptionManager:
     """订阅管理器，负责订阅的增删改查"""
     
-    def __init__(self, article_manager: ArticleManager, ai_summarizer=None, filename: str = "subscriptions.json"):
+    def __init__(self, article_manager: ArticleManager, ai_summarizer=None, filename: str = "subscriptions.json", console: Console = shared_console):
         self.filename = filename
         self.file_handler = FileHandler()
+        self.console = console
+        # 内存中的订阅列表及读取时文件的 (修改时间，文件大小)，文件未变化时无需重新读取和解析
+        self._subscriptions: Optional[Dict[str, str]] = None
+        self._subscriptions_signature: Optional[Tuple[int, int]] = None
+        # 订阅 URL -> 订阅名称的反向索引，与订阅列表同步更新，用于 O(1) 判断订阅是否已存在
+        self._url_to_title: Dict[str, str] = {}
+        # 按显示顺序排列的 (订阅名称，订阅 URL) 列表，按序号取订阅时直接索引
+        self._items: List[Tuple[str, str]] = []
         # 使用传入的AI摘要器创建RssParser，避免重复初始化
-        self.rss_parser = RssParser(article_manager=article_manager, ai_summarizer=ai_summarizer)
-        self.console = Console()
+        self.rss_parser = RssParser(article_manager=article_manager, ai_summarizer=ai_summarizer, console=console)
+    
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        """返回订阅文件的 (修改时间，文件大小)，文件不存在时返回 None"""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _load(self) -> Dict[str, str]:
+        """
+        加载订阅列表，文件自上次读取或写入后没有变化时直接返回内存中的结果
+
+        Returns:
+            Dict[str, str]: 订阅名称到订阅 URL 的映射（共享对象，修改前需先复制）
+        """
+        signature = self._file_signature()
+        if self._subscriptions is None or signature != self._subscriptions_signature:
+            self._subscriptions = self.file_handler.load_subscriptions(self.filename)
+            self._subscriptions_signature = signature
+            self._url_to_title = {url: title for title, url in self._subscriptions.items()}
+            self._items = list(self._subscriptions.items())
+        return self._subscriptions
+    
+    def _save(self, subscriptions: Dict[str, str]) -> bool:
+        """
+        保存订阅列表到文件，成功后同步更新内存中的结果
+
+        Args:
+            subscriptions (Dict[str, str]): 新的订阅列表
+
+        Returns:
+            bool: 是否保存成功
+        """
+        if not self.file_handler.save_subscriptions(self.filename, subscriptions):
+            return False
+        
+        self._subscriptions = subscriptions
+        self._subscriptions_signature = self._file_signature()
+        self._url_to_title = {url: title for title, url in subscriptions.items()}
+        self._items = list(subscriptions.items())
+        return True
     
     def add_subscription(self, url: str) -> bool:
         """
@@ -36,12 +87,12 @@ class SubscriptionManager:
         if not success or not title:
             return False
         
-        # 加载现有订阅
-        subscriptions = self.file_handler.load_subscriptions(self.filename)
+        # 加载现有订阅（复制一份，保存成功前不影响内存中的订阅列表）
+        subscriptions = dict(self._load())
         
         # 检查是否已存在相同的 URL（避免重复订阅）
-        if url in subscriptions.values():
-            existing_name = next(name for name, existing_url in subscriptions.items() if existing_url == url)
+        existing_name = self._url_to_title.get(url)
+        if existing_name is not None:
             warning_panel = Panel(
                 f"[yellow]⚠️  订阅已存在：'{existing_name}' [/yellow]",
                 style="yellow",
@@ -61,7 +112,7 @@ class SubscriptionManager:
         subscriptions[title] = url
         
         # 保存订阅到文件
-        if self.file_handler.save_subscriptions(self.filename, subscriptions):
+        if self._save(subscriptions):
             success_panel = Panel(
                 f"[bold green]🎉 订阅 '{title}' 已成功保存！[/bold green]",
                 style="green",
@@ -81,13 +132,12 @@ class SubscriptionManager:
         Returns:
             Tuple[Optional[str], Optional[str]]: (订阅名称，订阅 URL)，如果序号无效返回 (None, None)
         """
-        subscriptions = self.file_handler.load_subscriptions(self.filename)
+        self._load()
         
-        if not subscriptions or number < 1 or number > len(subscriptions):
+        if number < 1 or number > len(self._items):
             return None, None
         
-        subscription_items = list(subscriptions.items())
-        return subscription_items[number - 1]
+        return self._items[number - 1]
 
     def delete_subscription(self, number: int) -> bool:
         """
@@ -100,8 +150,8 @@ class SubscriptionManager:
         Returns:
             bool: 是否删除成功
         """
-        # 从 subscriptions.json 文件中加载订阅列表
-        subscriptions = self.file_handler.load_subscriptions(self.filename)
+        # 从 subscriptions.json 文件中加载订阅列表（复制一份，保存成功前不影响内存中的订阅列表）
+        subscriptions = dict(self._load())
         
         if not subscriptions:
             warning_panel = Panel(
@@ -118,14 +168,13 @@ class SubscriptionManager:
             return False
         
         # 获取订阅列表，确保与显示时的顺序一致
-        subscription_items = list(subscriptions.items())
-        subscription_name, subscription_url = subscription_items[number - 1]
+        subscription_name, subscription_url = self._items[number - 1]
         
         # 从字典中删除订阅
         del subscriptions[subscription_name]
         
         # 保存更新后的订阅列表
-        if self.file_handler.save_subscriptions(self.filename, subscriptions):
+        if self._save(subscriptions):
             success_panel = Panel(
                 f"[bold green]🎉 订阅 '{subscription_name}' 已成功删除！[/bold green]",
                 style="green",
@@ -138,8 +187,9 @@ class SubscriptionManager:
     def get_subscriptions(self) -> Dict[str, str]:
         """
         1. 从 subscriptions.json 文件中加载 RSS 订阅源；
+        2. 文件未变化时直接返回内存中的订阅列表，调用方不应修改返回的字典。
         """
-        return self.file_handler.load_subscriptions(self.filename)
+        return self._load()
     
     def get_subscription_by_index(self, index: int) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -151,11 +201,10 @@ class SubscriptionManager:
         Returns:
             Tuple[Optional[str], Optional[str]]: (订阅名称，订阅 URL)
         """
-        # 获取所有订阅
-        subscriptions = self.get_subscriptions()
+        # 加载订阅（文件未变化时直接使用内存中的列表）
+        self._load()
         # 检查索引是否有效
-        if not subscriptions or index < 1 or index > len(subscriptions):
+        if index < 1 or index > len(self._items):
             return None, None
         # 获取订阅名称和 URL
-        subscription_items = list(subscriptions.items())
-        return subscription_items[index - 1]
+        return self._items[index - 1]
@@ -2,243 +2,328 @@
 User interface handling and display logic.
 """
 
-import textwrap
+import re
 import webbrowser
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List
+from functools import cached_property, lru_cache, partial
+from typing import Dict, List, Optional
 
-from rich.console import Console
+from rich.console import Console, Group
+from rich.markup import escape
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
+from .console import shared_console
 from .models import NavigationAction
 from .subscription_manager import SubscriptionManager
 from .rss_parser import RssParser
 from .article_manager import ArticleManager
 
 
-class UserInterface:
-    """用户界面处理器，负责用户交互和界面显示"""
+# 列表项的标记
+_LIST_PREFIXES = ('- ', '• ', '* ', '1. ', '2. ', '3. ', '4. ', '5. ')
+# 匹配到最后一个可以作为换行断点的标点符号为止
+_BREAK_RE = re.compile(r'.*[，。！？；：、 ,.!?;:]', re.DOTALL)
+
+# 主菜单内容固定不变，模块加载时创建一次，每次显示时直接复用
+_MAIN_MENU_PANEL = Panel(
+    """[bold cyan]📰 RSS 订阅管理 [/bold cyan]
+
+1. [green] 添加新的订阅 [/green]
+2. [blue] 查看所有订阅 [/blue]  
+0. [red] 退出 [/red]""",
+    title="[bold yellow] 主菜单 [/bold yellow]",
+    border_style="bright_blue",
+    padding=(1, 2)
+)
+
+# 预先绑定固定参数的 Panel 工厂：文章面板和黄色提示面板
+_make_article_panel = partial(Panel, title_align="left", border_style="dim", padding=(0, 1))
+_make_warning_panel = partial(Panel, style="yellow", border_style="yellow")
+
+# 订阅列表表格的列配置：(列名, add_column 的参数)
+_SUBS_TABLE_COLUMNS = (
+    ("序号", {"style": "bold blue", "justify": "center", "width": 6}),
+    ("订阅名称", {"style": "bold white", "min_width": 20}),
+    ("RSS 链接", {"style": "dim blue", "overflow": "fold"}),
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_summary_text(text: str, width: int = 75, max_len: int = 400) -> str:
+    """
+    改进的文本格式化函数，更好地处理中文和列表格式
     
-    def __init__(self):
-        # 导入 AI 摘要器
-        from .ai_summarizer_refactored import create_ai_summarizer_from_config
-        
-        # 创建共享的 AI 摘要器实例
-        self.ai_summarizer = create_ai_summarizer_from_config()
-        
-        # 创建其他组件，传入共享的 AI 摘要器
-        self.article_manager = ArticleManager()
-        self.subscription_manager = SubscriptionManager(
-            article_manager=self.article_manager, 
-            ai_summarizer=self.ai_summarizer
-        )
-        self.rss_parser = RssParser(
-            article_manager=self.article_manager, 
-            ai_summarizer=self.ai_summarizer
-        )
-        self.console = Console()
+    结果只取决于 (text, width, max_len)，使用 lru_cache 缓存，翻页回到同一篇文章时直接复用。
     
-    def _format_summary_text(self, text: str, width: int = 75) -> str:
-        """
-        改进的文本格式化函数，更好地处理中文和列表格式
-        
-        Args:
-            text: 要格式化的文本
-            width: 每行最大字符数
-            
-        Returns:
-            格式化后的文本
-        """
-        if not text:
-            return text
-        
-        # 对于较短的文本，直接返回
-        if len(text) <= width:
-            return text
-        
-        lines = text.split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                formatted_lines.append('')
-                continue
-            
-            # 如果行不太长，直接添加
-            if len(line) <= width:
-                formatted_lines.append(line)
-                continue
-                
-            # 对于长行，进行智能分割
-            if line.startswith(('- ', '• ', '* ', '1. ', '2. ', '3. ')):
-                # 列表项的处理
-                formatted_lines.extend(self._format_list_item(line, width))
-            else:
-                # 普通段落的处理
-                formatted_lines.extend(self._format_paragraph(line, width))
-        
-        return '\n'.join(formatted_lines)
+    Args:
+        text: 要格式化的文本
+        width: 每行最大字符数
+        max_len: 文本最大长度，超出部分截断并以 "..." 结尾
     
-    def _format_list_item(self, line: str, width: int) -> List[str]:
-        """
-        格式化列表项
-        
-        Args:
-            line: 列表项文本
-            width: 最大宽度
-            
-        Returns:
-            格式化后的行列表
-        """
-        # 提取列表标记
-        marker = ''
-        content = line
-        for prefix in ['- ', '• ', '* ', '1. ', '2. ', '3. ', '4. ', '5. ']:
-            if line.startswith(prefix):
-                marker = prefix
-                content = line[len(prefix):].strip()
-                break
-        
-        if not marker:
-            # 不是标准列表项，按普通段落处理
-            return self._format_paragraph(line, width)
-        
-        formatted_lines = []
-        remaining = content
-        is_first_line = True
-        
-        while remaining:
-            available_width = width - (len(marker) if is_first_line else 2)
-            
-            if len(remaining) <= available_width:
-                # 剩余内容可以放在一行
-                if is_first_line:
-                    formatted_lines.append(marker + remaining)
-                else:
-                    formatted_lines.append('  ' + remaining)
-                break
-            
-            # 寻找合适的断点
-            breakpoint = self._find_breakpoint(remaining, available_width)
-            
+    Returns:
+        格式化后的文本
+    """
+    if not text:
+        return text
+    
+    if len(text) > max_len:
+        text = text[:max_len - 3] + "..."
+    
+    # 对于较短的文本，直接返回
+    if len(text) <= width:
+        return text
+    
+    lines = text.split('\n')
+    formatted_lines = []
+    
+    for line in lines:
+        line = line.strip()
+        if not line:
+            formatted_lines.append('')
+            continue
+    
+        # 如果行不太长，直接添加
+        if len(line) <= width:
+            formatted_lines.append(line)
+            continue
+    
+        # 对于长行，进行智能分割
+        if line.startswith(_LIST_PREFIXES):
+            # 列表项的处理
+            formatted_lines.extend(_format_list_item(line, width))
+        else:
+            # 普通段落的处理
+            formatted_lines.extend(_format_paragraph(line, width))
+    
+    return '\n'.join(formatted_lines)
+
+
+def _format_list_item(line: str, width: int) -> List[str]:
+    """
+    格式化列表项
+    
+    Args:
+        line: 列表项文本
+        width: 最大宽度
+    
+    Returns:
+        格式化后的行列表
+    """
+    if not line.startswith(_LIST_PREFIXES):
+        # 不是标准列表项，按普通段落处理
+        return _format_paragraph(line, width)
+    
+    # 提取列表标记
+    marker = next(prefix for prefix in _LIST_PREFIXES if line.startswith(prefix))
+    content = line[len(marker):].strip()
+    
+    formatted_lines = []
+    remaining = content
+    is_first_line = True
+    
+    while remaining:
+        available_width = width - (len(marker) if is_first_line else 2)
+    
+        if len(remaining) <= available_width:
+            # 剩余内容可以放在一行
             if is_first_line:
-                formatted_lines.append(marker + remaining[:breakpoint])
-                is_first_line = False
+                formatted_lines.append(marker + remaining)
             else:
-                formatted_lines.append('  ' + remaining[:breakpoint])
-            
-            remaining = remaining[breakpoint:].lstrip()
-        
-        return formatted_lines
+                formatted_lines.append('  ' + remaining)
+            break
     
-    def _format_paragraph(self, line: str, width: int) -> List[str]:
-        """
-        格式化普通段落
-        
-        Args:
-            line: 段落文本
-            width: 最大宽度
-            
-        Returns:
-            格式化后的行列表
-        """
-        formatted_lines = []
-        remaining = line
-        
-        while remaining:
-            if len(remaining) <= width:
-                formatted_lines.append(remaining)
-                break
-            
-            breakpoint = self._find_breakpoint(remaining, width)
-            formatted_lines.append(remaining[:breakpoint])
-            remaining = remaining[breakpoint:].lstrip()
-        
-        return formatted_lines
+        # 寻找合适的断点
+        breakpoint = _find_breakpoint(remaining, available_width)
     
-    def _find_breakpoint(self, text: str, max_width: int) -> int:
-        """
-        查找合适的断点位置
-        
-        Args:
-            text: 文本内容
-            max_width: 最大宽度
-            
-        Returns:
-            断点位置
-        """
-        if len(text) <= max_width:
-            return len(text)
+        if is_first_line:
+            formatted_lines.append(marker + remaining[:breakpoint])
+            is_first_line = False
+        else:
+            formatted_lines.append('  ' + remaining[:breakpoint])
+    
+        remaining = remaining[breakpoint:].lstrip()
+    
+    return formatted_lines
+
+
+def _format_paragraph(line: str, width: int) -> List[str]:
+    """
+    格式化普通段落
+    
+    Args:
+        line: 段落文本
+        width: 最大宽度
+    
+    Returns:
+        格式化后的行列表
+    """
+    formatted_lines = []
+    remaining = line
+    
+    while remaining:
+        if len(remaining) <= width:
+            formatted_lines.append(remaining)
+            break
+    
+        breakpoint = _find_breakpoint(remaining, width)
+        formatted_lines.append(remaining[:breakpoint])
+        remaining = remaining[breakpoint:].lstrip()
+    
+    return formatted_lines
+
+
+def _find_breakpoint(text: str, max_width: int) -> int:
+    """
+    查找合适的断点位置
+    
+    Args:
+        text: 文本内容
+        max_width: 最大宽度
+    
+    Returns:
+        断点位置
+    """
+    if len(text) <= max_width:
+        return len(text)
+    
+    # 在后半行的标点符号处寻找断点（从 max_width 往前找，最远到 max_width // 2 之后）；
+    # 贪婪匹配会停在范围内最后一个标点之后，查找在正则引擎内完成，无需逐字符循环
+    match = _BREAK_RE.match(text, max_width // 2 + 1, min(max_width, len(text) - 1) + 1)
+    if match:
+        return match.end()
+    
+    # 如果没有找到合适的标点符号，直接在最大宽度处断开
+    return max_width
+
+
+@lru_cache(maxsize=4096)
+def _format_fetch_time(fetch_time: str) -> Optional[str]:
+    """
+    把 ISO 格式的获取时间转换为显示用的字符串，同一批文章的获取时间相同，结果会被缓存复用
+    
+    Args:
+        fetch_time: ISO 格式的时间字符串
         
-        # 在标点符号处寻找断点
-        punctuation = '，。！？；：、 ,.!?;: '
-        for i in range(min(max_width, len(text) - 1), max(max_width // 2, 0), -1):
-            if text[i] in punctuation:
-                return i + 1
+    Returns:
+        格式化后的时间字符串，无法解析时返回 None
+    """
+    try:
+        return datetime.fromisoformat(fetch_time).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+
+
+def _truncate_url(url: str, limit: int = 60) -> str:
+    """
+    限制 URL 的显示长度
+    
+    Args:
+        url: 原始 URL
+        limit: 最大显示长度
         
-        # 如果没有找到合适的标点符号，直接在最大宽度处断开
-        return max_width
+    Returns:
+        不超过 limit 个字符的 URL，过长时以 "..." 结尾
+    """
+    return f"{url[:limit - 3]}..." if len(url) > limit else url
+
 
+def _build_subs_table_skeleton() -> Table:
+    """
+    创建只包含列定义的订阅列表表格，每次显示的行不同，所以表格本身每次新建
+    
+    Returns:
+        尚未添加任何行的 Table
+    """
+    table = Table(title="[bold cyan]📚 您已保存的订阅 [/bold cyan]", show_header=True, header_style="bold magenta")
+    for header, options in _SUBS_TABLE_COLUMNS:
+        table.add_column(header, **options)
+    return table
+
+
+class UserInterface:
+    """用户界面处理器，负责用户交互和界面显示"""
+    
+    # 文章面板缓存的最大条目数
+    PANEL_CACHE_SIZE = 200
+    # 文章列表每页显示的文章数
+    ARTICLES_PAGE_SIZE = 5
+    
+    def __init__(self, console: Console = shared_console):
+        self.console = console
+        # (页内序号，文章链接，是否有 AI 摘要) -> 已构建的文章面板，按最近使用顺序淘汰
+        self._panel_cache: "OrderedDict[tuple, Panel]" = OrderedDict()
+    
+    # 以下组件在首次使用时才创建：只添加或删除订阅、直接退出时，无需读取 AI 配置和初始化 AI 客户端
+    
+    @cached_property
+    def article_manager(self) -> ArticleManager:
+        """文章管理器"""
+        return ArticleManager()
+    
+    @cached_property
+    def subscription_manager(self) -> SubscriptionManager:
+        """订阅管理器"""
+        return SubscriptionManager(article_manager=self.article_manager, console=self.console)
+    
+    @cached_property
+    def rss_parser(self) -> RssParser:
+        """RSS 解析器，与订阅管理器共用同一个实例（同一个 HTTP 会话和解析缓存）"""
+        return self.subscription_manager.rss_parser
+    
+    @property
+    def ai_summarizer(self):
+        """共享的 AI 摘要器，由 RSS 解析器在首次需要生成摘要时创建"""
+        return self.rss_parser.ai_summarizer
+    
     def show_main_menu(self):
         """显示美化的主菜单"""
-        main_menu = Panel(
-            """[bold cyan]📰 RSS 订阅管理 [/bold cyan]
-
-1. [green] 添加新的订阅 [/green]
-2. [blue] 查看所有订阅 [/blue]  
-0. [red] 退出 [/red]""",
-            title="[bold yellow] 主菜单 [/bold yellow]",
-            border_style="bright_blue",
-            padding=(1, 2)
-        )
-        self.console.print(main_menu)
+        self.console.print(_MAIN_MENU_PANEL)
     
     def show_subscriptions_menu(self, subscriptions: Dict[str, str]):
         """显示美化的订阅列表菜单"""
         # 创建订阅列表表格
-        table = Table(title="[bold cyan]📚 您已保存的订阅 [/bold cyan]", show_header=True, header_style="bold magenta")
-        table.add_column("序号", style="bold blue", justify="center", width=6)
-        table.add_column("订阅名称", style="bold white", min_width=20)
-        table.add_column("RSS 链接", style="dim blue", overflow="fold")
+        table = _build_subs_table_skeleton()
         
-        for i, (name, url) in enumerate(subscriptions.items(), 1):
-            # 限制 URL 显示长度
-            display_url = url if len(url) <= 60 else url[:57] + "..."
-            table.add_row(str(i), name, display_url)
+        # 先一次性生成全部行（同时限制 URL 显示长度），再逐行加入表格
+        rows = [(str(i), name, _truncate_url(url)) for i, (name, url) in enumerate(subscriptions.items(), 1)]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
         
         self.console.print(table)
         
-        # 操作选项
-        print("\n操作选项：")
-        print(f"[1-{len(subscriptions)}] 进入对应订阅查看文章")
-        print("[d]  删除订阅")
-        print("[0]  返回首页")
+        # 操作选项（拼接后一次性输出）
+        print("\n".join((
+            "\n操作选项：",
+            f"[1-{len(subscriptions)}] 进入对应订阅查看文章",
+            "[d]  删除订阅",
+            "[0]  返回首页",
+        )))
     
     def show_articles_menu(self, articles: List[Dict[str, str]], current_page: int = 1, total_pages: int = 1):
         """显示文章列表菜单"""
-        print("\n操作选项：")
-        print("[0] 返回首页")
-        print("[b] 返回订阅列表") 
-        print("[r] 刷新文章列表")
+        # 先收集全部菜单行，最后一次性输出
+        lines = ["\n操作选项：", "[0] 返回首页", "[b] 返回订阅列表", "[r] 刷新文章列表"]
         
         if articles:
-            print(f"[1-{len(articles)}] 查看对应文章详情")
+            lines.append(f"[1-{len(articles)}] 查看对应文章详情")
         else:
-            print("暂无文章可查看")
+            lines.append("暂无文章可查看")
 
         # 分页导航
         if current_page > 1:
-            print("[p] 上一页")
+            lines.append("[p] 上一页")
         if current_page < total_pages:
-            print("[n] 下一页")
+            lines.append("[n] 下一页")
             
         # 显示页码信息
         if total_pages > 1:
-            print(f"\n📄 当前第 {current_page}/{total_pages} 页")
-        print()    
+            lines.append(f"\n📄 当前第 {current_page}/{total_pages} 页")
+        lines.append("")
+        print("\n".join(lines))
 
     def display_articles(self, articles: List[Dict[str, str]], subscription_name: str, current_page: int = 1, total_pages: int = 1):
         """
@@ -257,61 +342,81 @@ class UserInterface:
             style="bright_blue",
             border_style="blue"
         )
-        self.console.print(title_panel)
         
         if not articles:
-            warning_panel = Panel(
-                "[yellow]⚠️  未能获取到文章，可能是网络问题或链接失效 [/yellow]",
-                style="yellow",
-                border_style="yellow"
+            warning_panel = _make_warning_panel(
+                "[yellow]⚠️  未能获取到文章，可能是网络问题或链接失效 [/yellow]"
             )
-            self.console.print(warning_panel)
+            self.console.print(Group(title_panel, warning_panel))
             return
         
-        # 为每篇文章创建美化的显示
+        # 整页内容先收集起来，最后合并为一次输出，避免每篇文章都单独刷新控制台
+        renderables = [title_panel]
+        
+        # 循环中用到的属性和方法先绑定到局部变量，避免每次迭代重复查找
+        panel_cache = self._panel_cache
+        build_panel = self._build_article_panel
+        cache_size = self.PANEL_CACHE_SIZE
+        append = renderables.append
+        spacer = Text()  # 空行分隔，内容不变，所有文章共用一个
+        
+        # 为每篇文章创建美化的显示（翻页回到同一页时直接复用已构建的面板）
         for i, article in enumerate(articles, 1):
-            # 文章标题
-            title_text = Text()
-            title_text.append(f"{i}. ", style="bold magenta")
-            title_text.append(article['title'], style="bold white")
-            
-            # 优先使用 AI 摘要，如果没有则使用原始摘要
-            summary = article.get('ai_summary') or article['summary']
-            if len(summary) > 400:
-                summary = summary[:397] + "..."
-            
-            # 改进的文本格式化，更好地处理中文和列表格式
-            wrapped_summary = self._format_summary_text(summary)
-            
-            # 创建文章内容，添加时间信息
-            article_content = f"""[bold blue]🔗 链接:[/bold blue] [link={article['link']}]{article['link']}[/link]"""
-            
-            # 添加发布时间（如果有的话）
-            if article.get('published'):
-                article_content += f"\n[bold yellow]📅 发布时间:[/bold yellow] {article['published']}"
-            
-            # 添加获取时间（如果有的话）
-            if article.get('fetch_time'):
-                try:
-                    fetch_datetime = datetime.fromisoformat(article['fetch_time'])
-                    fetch_time_str = fetch_datetime.strftime("%Y-%m-%d %H:%M:%S")
-                    article_content += f"\n[bold green]⏰ 获取时间:[/bold green] {fetch_time_str}"
-                except ValueError:
-                    pass
-            
-            article_content += f"\n\n[bold green]📄 摘要:[/bold green]\n{wrapped_summary}"
-            
-            # 创建文章面板
-            article_panel = Panel(
-                article_content,
-                title=title_text,
-                title_align="left",
-                border_style="dim",
-                padding=(0, 1)
-            )
+            cache_key = (i, article['link'], article.get('ai_summary') is not None)
+            article_panel = panel_cache.get(cache_key)
+            if article_panel is None:
+                article_panel = build_panel(i, article)
+                panel_cache[cache_key] = article_panel
+                if len(panel_cache) > cache_size:
+                    panel_cache.popitem(last=False)
+            else:
+                panel_cache.move_to_end(cache_key)
             
-            self.console.print(article_panel)
-            self.console.print()  # 添加空行分隔
+            append(article_panel)
+            append(spacer)
+        
+        self.console.print(Group(*renderables))
+    
+    def _build_article_panel(self, index: int, article: Dict[str, str]) -> Panel:
+        """
+        构建单篇文章的显示面板
+
+        Args:
+            index (int): 文章在当前页中的序号
+            article (Dict[str, str]): 文章数据
+
+        Returns:
+            Panel: 文章面板
+        """
+        # 文章标题
+        title_text = f"[bold magenta]{index}. [/bold magenta][bold white]{escape(article['title'])}[/bold white]"
+        
+        # 优先使用 AI 摘要，如果没有则使用原始摘要
+        summary = article.get('ai_summary') or article['summary']
+        
+        # 改进的文本格式化（同时限制摘要长度），更好地处理中文和列表格式
+        wrapped_summary = _format_summary_text(summary, 75, 400)
+        
+        # 创建文章内容，添加时间信息（各行先收集到列表中，最后一次性拼接）
+        parts = [f"[bold blue]🔗 链接:[/bold blue] [link={article['link']}]{article['link']}[/link]"]
+        
+        # 添加发布时间（如果有的话）
+        if article.get('published'):
+            parts.append(f"[bold yellow]📅 发布时间:[/bold yellow] {article['published']}")
+        
+        # 添加获取时间（如果有的话）
+        fetch_time_str = _format_fetch_time(article['fetch_time']) if article.get('fetch_time') else None
+        if fetch_time_str:
+            parts.append(f"[bold green]⏰ 获取时间:[/bold green] {fetch_time_str}")
+        
+        parts.append("")
+        parts.append(f"[bold green]📄 摘要:[/bold green]\n{wrapped_summary}")
+        article_content = "\n".join(parts)
+        
+        # 创建文章面板
+        article_panel = _make_article_panel(article_content, title=title_text)
+        
+        return article_panel
     
     def get_user_input(self, prompt: str) -> str:
         """获取用户输入"""
@@ -365,7 +470,7 @@ class UserInterface:
                     return NavigationAction.BACK_TO_HOME
                 
                 # 删除订阅源
-                if choice.lower() == "d":
+                if choice in ("d", "D"):
                     number_input = self.get_user_input("请输入要删除的订阅序号：")
                     try:
                         number = int(number_input)
@@ -408,35 +513,36 @@ class UserInterface:
         """
         current_page = 1
         page_message = None  # 用于存储需要在文章列表后显示的消息
+        last_rendered = None  # 上一次绘制时的 (页码, 总页数)，为 None 表示需要重新绘制
         
         # 首次进入时获取最新文章并保存到历史记录
         print("\n🔄 正在获取最新文章...")
         self.rss_parser.fetch_and_save_articles(subscription_url)
         
         while True:
-            # 获取当前订阅源的历史文章，分页展示
+            # 获取当前订阅源的历史文章，分页展示（ArticleManager 缓存了排序后的文章列表，翻页只是切片）
             articles, _, current_page, total_pages = self.article_manager.get_paginated_articles(
-                subscription_url, page_size=5, page=current_page
+                subscription_url, page_size=self.ARTICLES_PAGE_SIZE, page=current_page
             )
             
-            # 显示文章
-            self.display_articles(articles, subscription_name, current_page, total_pages)
-            
-            # 显示菜单
-            self.show_articles_menu(articles, current_page, total_pages)
+            # 页面内容没有变化（如在首页按 p、在末页按 n）时不重新绘制，屏幕上已是当前页
+            render_state = (current_page, total_pages)
+            if render_state != last_rendered:
+                # 显示文章
+                self.display_articles(articles, subscription_name, current_page, total_pages)
+                
+                # 显示菜单
+                self.show_articles_menu(articles, current_page, total_pages)
+                last_rendered = render_state
             
             # 在菜单后显示上一轮操作的提示消息（如已在首页/末页）。
-            # 这种延迟显示的设计可以确保用户在看到提示时，界面已刷新为当前页，用户体验更佳。
+            # 这种延迟显示的设计可以确保用户在看到提示时，界面已是当前页，用户体验更佳。
             message_map = {
                 "first_page": "[yellow]😊 已经是第一页啦~ [/yellow]",
                 "last_page": "[yellow]😊 已经是最后一页啦~ [/yellow]",
             }
             if page_message in message_map:
-                info_panel = Panel(
-                    message_map[page_message],
-                    style="yellow",
-                    border_style="yellow"
-                )
+                info_panel = _make_warning_panel(message_map[page_message])
                 self.console.print(info_panel)
             
             # 每次循环后重置消息状态，确保提示只显示一次
@@ -450,9 +556,11 @@ class UserInterface:
                 return NavigationAction.BACK_TO_HOME
             elif choice == "r":
                 print("\n🔄 正在刷新...")
-                # 获取最新文章并保存到历史记录
-                self.rss_parser.fetch_and_save_articles(subscription_url)
+                # 用户主动刷新时跳过缓存，获取最新文章并保存到历史记录
+                self.rss_parser.fetch_and_save_articles(subscription_url, use_cache=False)
+                self._panel_cache.clear()  # 文章内容可能已变化，丢弃缓存的面板
                 current_page = 1  # 刷新后回到第一页
+                last_rendered = None  # 强制重新绘制
                 continue
             elif choice == "p":
                 # 上一页
@@ -470,8 +578,13 @@ class UserInterface:
                     # 设置标志，在显示文章后显示提示
                     page_message = "last_page"
                 continue
-            elif choice.isdigit():
-                choice_num = int(choice)
+            else:
+                # 直接尝试转换为整数，不是数字时视为无效输入
+                try:
+                    choice_num = int(choice)
+                except ValueError:
+                    print(" 无效的选择，请重新输入。")
+                    continue
                 if 1 <= choice_num <= len(articles):
                     # 调用浏览器打开文章链接
                     article = articles[choice_num - 1]
@@ -480,5 +593,6 @@ class UserInterface:
                         webbrowser.open(article['link'])
                     except Exception as e:
                         print(f" 无法打开链接：{e}")
-            else:
-                print(" 无效的选择，请重新输入。")
+                else:
+                    # 序号超出当前页的范围（如 -1、99）
+                    print(" 无效的选择，请重新输入。")